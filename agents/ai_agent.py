@@ -6,7 +6,7 @@ from config import (
     GEMINI_API_KEY
 )
 from utils.logger import logger
-from utils.data_models import AIResult
+from utils.data_models import AIResult, PriceUpdate
 
 class AzureWrapper:
     def __init__(self):
@@ -47,12 +47,13 @@ class AIAgent:
         self.azure = AzureWrapper()
         self.gemini = GeminiWrapper()
 
-    def analyze(self, data) -> AIResult:
+    def analyze(self, price_update: PriceUpdate) -> AIResult:
         """
-        Analyze market data using AI models with fallback
+        Analyze a price update using AI models with fallback
         """
+        prompt = self._format_prompt(price_update)
         try:
-            response = self.azure.generate_response(self._format_prompt(data))
+            response = self.azure.generate_response(prompt)
             return AIResult(
                 analysis=response,
                 source="azure",
@@ -61,7 +62,7 @@ class AIAgent:
         except Exception as e:
             logger.warning(f"Azure analysis failed, falling back to Gemini: {e}")
             try:
-                response = self.gemini.generate_response(self._format_prompt(data))
+                response = self.gemini.generate_response(prompt)
                 return AIResult(
                     analysis=response,
                     source="gemini",
@@ -71,16 +72,16 @@ class AIAgent:
                 logger.error(f"Both AI services failed: {e}")
                 raise
 
-    def _format_prompt(self, data) -> str:
+    def _format_prompt(self, price_update: PriceUpdate) -> str:
         """
-        Format market data into a prompt for AI analysis
+        Format a price update into a prompt for AI analysis
         """
         return f"""
         Analyze the following market data and provide trading insights:
-        Symbol: {data.get('symbol')}
-        Current Price: {data.get('price')}
-        Volume: {data.get('volume')}
-        Technical Indicators: {data.get('indicators')}
+        Symbol: {price_update.symbol}
+        Current Price: {price_update.price}
+        Volume: {price_update.volume}
+        Technical Indicators: {price_update.indicators}
         
         Please provide:
         1. Market sentiment
@@ -1,18 +1,17 @@
 import asyncio
-from binance import AsyncClient
 from alpaca.trading.stream import Stream
-from config import BINANCE_API_KEY, BINANCE_API_SECRET, ALPACA_API_KEY, ALPACA_API_SECRET
+from config import ALPACA_API_KEY, ALPACA_API_SECRET
+from feeds.price_feed_ws import stream_prices
 from utils.logger import logger
 from utils.data_models import PriceUpdate
 
 class MarketDataAgent:
-    def __init__(self):
-        self._binance_client = None
+    def __init__(self, binance_symbols=('BTCUSDT',)):
+        self.binance_symbols = binance_symbols
         self._alpaca_stream = None
         self._price_callbacks = []
 
     async def initialize(self):
-        self._binance_client = await AsyncClient(BINANCE_API_KEY, BINANCE_API_SECRET)
         self._alpaca_stream = Stream(ALPACA_API_KEY, ALPACA_API_SECRET)
 
     async def start(self):
@@ -22,21 +21,8 @@ class MarketDataAgent:
         )
 
     async def _run_binance_ws(self):
-        while True:
-            try:
-                ts = self._binance_client.symbol_ticker_socket('BTCUSDT')
-                async with ts as stream:
-                    while True:
-                        res = await stream.recv()
-                        self._publish_price(PriceUpdate(
-                            symbol=res['s'],
-                            price=float(res['c']),
-                            timestamp=res['E'],
-                            source='binance'
-                        ))
-            except Exception as e:
-                logger.error(f"Binance WebSocket error: {e}")
-                await asyncio.sleep(5)
+        # Ticker messages are published directly from the stream coroutine
+        await stream_prices(self.binance_symbols, self._publish_price)
 
     async def _run_alpaca_ws(self):
         try:
@@ -63,7 +49,5 @@ class MarketDataAgent:
         self._price_callbacks.append(callback)
 
     async def cleanup(self):
-        if self._binance_client:
-            await self._binance_client.close_connection()
         if self._alpaca_stream:
             await self._alpaca_stream.close() 
\ No newline at end of file
@@ -1,3 +1,5 @@
+import asyncio
+from typing import Tuple
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from alpaca.trading.client import TradingClient
@@ -106,4 +108,21 @@ class TradingAgent:
         if exchange == 'binance':
             return self.binance.place_order(symbol, 'SELL' if side == 'BUY' else 'BUY', qty=1, order_type='LIMIT')
         else:
-            return self.alpaca.place_order(symbol, 'sell' if side == 'buy' else 'buy', qty=1, order_type='limit') 
\ No newline at end of file
+            return self.alpaca.place_order(symbol, 'sell' if side == 'buy' else 'buy', qty=1, order_type='limit')
+
+    async def execute_trade_with_brackets(self, symbol: str, side: str, qty: float, entry_price: float,
+                                          exchange: str = 'binance') -> Tuple[OrderReceipt, OrderReceipt, OrderReceipt]:
+        """
+        Execute a trade and place its stop loss and take profit orders.
+        The two bracket orders are sent concurrently once the entry is accepted,
+        so the trade costs two exchange round-trips instead of three.
+        
+        Returns:
+            Tuple of (entry order, stop loss order, take profit order)
+        """
+        order = await asyncio.to_thread(self.execute_trade, symbol, side, qty, exchange)
+        stop_loss, take_profit = await asyncio.gather(
+            asyncio.to_thread(self.set_stop_loss, symbol, entry_price, side, exchange),
+            asyncio.to_thread(self.set_take_profit, symbol, entry_price, side, exchange)
+        )
+        return order, stop_loss, take_profit 
\ No newline at end of file
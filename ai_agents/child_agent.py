@@ -13,9 +13,10 @@ class ChildAgent:
         """
         logger.info(f"Executing strategy '{strategy}' for {self.symbol}")
         
-        if strategy in self.strategy_functions:
+        strategy_fn = self.strategy_functions.get(strategy)
+        if strategy_fn is not None:
             try:
-                result = self.strategy_functions[strategy](self.symbol)
+                result = strategy_fn(self.symbol)
                 self.last_execution = {
                     'strategy': strategy,
                     'result': result,
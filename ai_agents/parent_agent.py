@@ -13,6 +13,9 @@ class ParentAgent:
     def analyze_and_delegate(self, market_data):
         """
         Analyze market data and delegate tasks to child agents
+        
+        The market_data dict may be reused by the caller for the next tick,
+        so it must not be retained after this call returns.
         """
         # Analyze data and decide strategy
         strategy = self._determine_strategy(market_data)
@@ -42,4 +42,7 @@ STRATEGIES = {
     'shift to stablecoins': shift_to_stablecoins,
     'increase risk exposure': increase_risk_exposure,
     'maintain current allocation': maintain_allocation
-} 
\ No newline at end of file
+}
+
+# Frozen (name, function) pairs for registering the strategies on agents
+STRATEGY_ITEMS = tuple(STRATEGIES.items()) 
\ No newline at end of file
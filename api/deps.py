@@ -0,0 +1,36 @@
+from functools import lru_cache
+
+# Import our components
+from signal_router import SignalRouter
+from ai_agent_parent import ParentAI
+from trading_bot_executor import TradeExecutor
+
+@lru_cache()
+def get_signal_router() -> SignalRouter:
+    """
+    Get the shared SignalRouter instance.
+
+    Returns:
+        SignalRouter used by every API router
+    """
+    return SignalRouter()
+
+@lru_cache()
+def get_parent_ai() -> ParentAI:
+    """
+    Get the shared ParentAI instance (the one owned by the signal router).
+
+    Returns:
+        ParentAI used by every API router
+    """
+    return get_signal_router().parent_agent
+
+@lru_cache()
+def get_trade_executor() -> TradeExecutor:
+    """
+    Get the shared TradeExecutor instance (the one owned by the signal router).
+
+    Returns:
+        TradeExecutor used by every API router
+    """
+    return get_signal_router().trade_executor
\ No newline at end of file
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
@@ -19,7 +20,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="NOS Trade API",
     description="API for NOS Trade trading system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
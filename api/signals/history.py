@@ -5,9 +5,7 @@ from pydantic import BaseModel
 from datetime import datetime, timedelta
 
 # Import our components
-from signal_router import SignalRouter
-from ai_agent_parent import ParentAI
-from trading_bot_executor import TradeExecutor
+from api.deps import get_signal_router, get_parent_ai, get_trade_executor
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -16,10 +14,10 @@ logger.setLevel(logging.INFO)
 # Create router
 router = APIRouter()
 
-# Initialize components
-signal_router = SignalRouter()
-parent_ai = ParentAI()
-trade_executor = TradeExecutor()
+# Shared components
+signal_router = get_signal_router()
+parent_ai = get_parent_ai()
+trade_executor = get_trade_executor()
 
 class HistoricalSignal(BaseModel):
     """Historical signal model"""
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, List, Any, Optional
+import asyncio
 import logging
 import time
 from pydantic import BaseModel
 from datetime import datetime
 
 # Import our components
-from signal_router import SignalRouter
-from ai_agent_parent import ParentAI
-from trading_bot_executor import TradeExecutor
+from api.deps import get_signal_router, get_parent_ai, get_trade_executor
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -17,10 +16,10 @@ logger.setLevel(logging.INFO)
 # Create router
 router = APIRouter()
 
-# Initialize components
-signal_router = SignalRouter()
-parent_ai = ParentAI()
-trade_executor = TradeExecutor()
+# Shared components
+signal_router = get_signal_router()
+parent_ai = get_parent_ai()
+trade_executor = get_trade_executor()
 
 class Alert(BaseModel):
     """Alert model"""
@@ -48,6 +47,12 @@ class SignalResponse(BaseModel):
     alerts: List[Alert]
     timestamp: float
 
+# Static confidence entries, built once
+ENSEMBLE_CONFIDENCE = ConfidenceData(name="Fibonacci Ensemble", confidence=0.8 * 100)  # Example confidence
+POSITION_CONFIDENCE = ConfidenceData(name="Position", confidence=100.0)
+
+LOW_CONFIDENCE_DESCRIPTION = "Signal confidence below 30%. Consider holding current position."
+
 @router.get("/api/signals/latest", response_model=SignalResponse)
 async def get_latest_signals():
     """
@@ -60,11 +65,13 @@ async def get_latest_signals():
         # Get market data
         market_data = signal_router._get_market_data()
         
-        # Get signals from the adapter system
-        adapter_signal = signal_router.fibonacci_factory.get_signal(market_data)
-        
-        # Get signals from the fibonacci ensemble
-        ensemble_signal = signal_router._get_ensemble_signal()
+        # Get signals from the adapter system and the fibonacci ensemble,
+        # along with the current position, concurrently
+        adapter_signal, ensemble_signal, position = await asyncio.gather(
+            asyncio.to_thread(signal_router.fibonacci_factory.get_signal, market_data),
+            asyncio.to_thread(signal_router._get_ensemble_signal),
+            asyncio.to_thread(trade_executor.get_position)
+        )
         
         # Combine signals
         combined_signal = signal_router._combine_signals(adapter_signal, ensemble_signal)
@@ -88,9 +95,6 @@ async def get_latest_signals():
             )
         ]
         
-        # Get current position
-        position = trade_executor.get_position()
-        
         # Add position to signals
         signals.append(
             Signal(
@@ -104,8 +108,8 @@ async def get_latest_signals():
         # Format confidence data for the chart
         confidences = [
             ConfidenceData(name="Fibonacci Adapter", confidence=adapter_signal["confidence"] * 100),
-            ConfidenceData(name="Fibonacci Ensemble", confidence=0.8 * 100),  # Example confidence
-            ConfidenceData(name="Position", confidence=100.0)
+            ENSEMBLE_CONFIDENCE,
+            POSITION_CONFIDENCE
         ]
         
         # Generate alerts based on signal analysis
@@ -138,7 +142,7 @@ async def get_latest_signals():
             alerts.append(
                 Alert(
                     title="Low Confidence Warning",
-                    description="Signal confidence below 30%. Consider holding current position.",
+                    description=LOW_CONFIDENCE_DESCRIPTION,
                     time=datetime.now().isoformat(),
                     severity="warning"
                 )
@@ -4,9 +4,7 @@ import logging
 from pydantic import BaseModel
 
 # Import our components
-from signal_router import SignalRouter
-from ai_agent_parent import ParentAI
-from trading_bot_executor import TradeExecutor
+from api.deps import get_signal_router, get_parent_ai, get_trade_executor
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -15,10 +13,10 @@ logger.setLevel(logging.INFO)
 # Create router
 router = APIRouter()
 
-# Initialize components
-signal_router = SignalRouter()
-parent_ai = ParentAI()
-trade_executor = TradeExecutor()
+# Shared components
+signal_router = get_signal_router()
+parent_ai = get_parent_ai()
+trade_executor = get_trade_executor()
 
 # Available strategies
 AVAILABLE_STRATEGIES = [
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import asyncio
+import io
 import logging
-import json
 import os
+import orjson
 from datetime import datetime
 
 from stress_test.multi_agent_simulator import MultiAgentSimulator, run_stress_test
@@ -20,6 +22,28 @@ router = APIRouter()
 stress_test_running = False
 stress_test_simulator = None
 stress_test_output_dir = "stress_test_output"
+stress_test_lock = asyncio.Lock()
+
+# Templates for the log summary
+SUMMARY_TEMPLATE = """
+Stress Test Summary
+------------------
+Total Operations: {total_ops}
+Successful Operations: {successful} ({success_rate:.1f}%)
+Failed Operations: {failed} ({failure_rate:.1f}%)
+Missing Data Events: {missing} ({missing_rate:.1f}%)
+Duration: {duration:.2f} seconds
+
+Agent Statistics:
+"""
+
+AGENT_SUMMARY_TEMPLATE = """
+{agent}:
+  Total Operations: {total}
+  Successful: {successful} ({success_rate:.1f}%)
+  Failed: {failed}
+  Missing Data: {missing}
+"""
 
 class StressTestConfig(BaseModel):
     """Configuration for stress test."""
@@ -56,8 +80,10 @@ async def start_stress_test(config: StressTestConfig, background_tasks: Backgrou
     """
     global stress_test_running, stress_test_simulator
     
-    if stress_test_running:
-        raise HTTPException(status_code=400, detail="Stress test is already running")
+    async with stress_test_lock:
+        if stress_test_running:
+            raise HTTPException(status_code=400, detail="Stress test is already running")
+        stress_test_running = True
     
     try:
         # Create output directory with timestamp
@@ -78,7 +104,6 @@ async def start_stress_test(config: StressTestConfig, background_tasks: Backgrou
         )
         
         # Run simulation in background
-        stress_test_running = True
         background_tasks.add_task(run_stress_test_in_background, output_dir)
         
         return StressTestResponse(
@@ -88,6 +113,8 @@ async def start_stress_test(config: StressTestConfig, background_tasks: Backgrou
         )
     
     except Exception as e:
+        async with stress_test_lock:
+            stress_test_running = False
         logger.error(f"Failed to start stress test: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to start stress test: {str(e)}")
 
@@ -101,14 +128,15 @@ async def stop_stress_test():
     """
     global stress_test_running, stress_test_simulator
     
-    if not stress_test_running:
-        raise HTTPException(status_code=400, detail="No stress test is currently running")
-    
-    try:
+    async with stress_test_lock:
+        if not stress_test_running:
+            raise HTTPException(status_code=400, detail="No stress test is currently running")
+        
         # Stop the simulator
         stress_test_running = False
         stress_test_simulator = None
-        
+    
+    try:
         return StressTestResponse(
             success=True,
             message="Stress test stopped successfully"
@@ -145,8 +173,8 @@ async def get_log_summary():
                 timestamp=datetime.now().isoformat()
             )
         
-        with open(stats_path, "r") as f:
-            stats = json.load(f)
+        with open(stats_path, "rb") as f:
+            stats = orjson.loads(f.read())
         
         # Generate summary
         total_ops = stats["total_operations"]
@@ -154,40 +182,43 @@ async def get_log_summary():
         failure_rate = (stats["failed_operations"] / total_ops) * 100 if total_ops > 0 else 0
         missing_rate = (stats["missing_data_events"] / total_ops) * 100 if total_ops > 0 else 0
         
-        # Calculate duration
-        start_time = datetime.fromisoformat(stats["start_time"])
-        end_time = datetime.fromisoformat(stats["end_time"])
-        duration = end_time - start_time
+        # Calculate duration from the monotonic clock readings; older statistics
+        # files only carry the ISO timestamps
+        if stats.get("end_monotonic") is not None:
+            duration_seconds = stats["end_monotonic"] - stats["start_monotonic"]
+        else:
+            duration_seconds = (
+                datetime.fromisoformat(stats["end_time"]) - datetime.fromisoformat(stats["start_time"])
+            ).total_seconds()
         
-        summary = f"""
-Stress Test Summary
-------------------
-Total Operations: {total_ops}
-Successful Operations: {stats["successful_operations"]} ({success_rate:.1f}%)
-Failed Operations: {stats["failed_operations"]} ({failure_rate:.1f}%)
-Missing Data Events: {stats["missing_data_events"]} ({missing_rate:.1f}%)
-Duration: {duration.total_seconds():.2f} seconds
-
-Agent Statistics:
-"""
+        buf = io.StringIO()
+        buf.write(SUMMARY_TEMPLATE.format(
+            total_ops=total_ops,
+            successful=stats["successful_operations"],
+            success_rate=success_rate,
+            failed=stats["failed_operations"],
+            failure_rate=failure_rate,
+            missing=stats["missing_data_events"],
+            missing_rate=missing_rate,
+            duration=duration_seconds
+        ))
         
         for agent, agent_stats in stats["agent_stats"].items():
             agent_total = agent_stats["total_operations"]
             agent_success = agent_stats["successful_operations"]
-            agent_failed = agent_stats["failed_operations"]
-            agent_missing = agent_stats["missing_data_events"]
             agent_success_rate = (agent_success / agent_total) * 100 if agent_total > 0 else 0
             
-            summary += f"""
-{agent}:
-  Total Operations: {agent_total}
-  Successful: {agent_success} ({agent_success_rate:.1f}%)
-  Failed: {agent_failed}
-  Missing Data: {agent_missing}
-"""
+            buf.write(AGENT_SUMMARY_TEMPLATE.format(
+                agent=agent,
+                total=agent_total,
+                successful=agent_success,
+                success_rate=agent_success_rate,
+                failed=agent_stats["failed_operations"],
+                missing=agent_stats["missing_data_events"]
+            ))
         
         return LogSummaryResponse(
-            summary=summary,
+            summary=buf.getvalue(),
             timestamp=datetime.now().isoformat()
         )
     
@@ -217,4 +248,5 @@ async def run_stress_test_in_background(output_dir: str):
         logger.error(f"Error in background stress test: {str(e)}")
     
     finally:
-        stress_test_running = False 
\ No newline at end of file
+        async with stress_test_lock:
+            stress_test_running = False 
\ No newline at end of file
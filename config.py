@@ -1,25 +1,51 @@
-# API credentials and endpoints
-BINANCE_API_KEY = "..."
-BINANCE_API_SECRET = "..."
-ALPACA_API_KEY = "..."
-ALPACA_API_SECRET = "..."
-ALPACA_BASE_URL = "https://paper-api.alpaca.markets"
-AZURE_OPENAI_ENDPOINT = "https://ocapulse.openai.azure.com/"
-AZURE_OPENAI_KEY = "Bod8Um..."
-AZURE_OPENAI_DEPLOYMENT = "gpt-4-llamav2"
-GEMINI_API_KEY = "AIzaSyDfnYm..."
+import os
+from functools import lru_cache
+from types import SimpleNamespace
+from dotenv import load_dotenv
 
-# Trading settings
-MAX_POSITION_SIZE = 1000  # Maximum position size in USD
-MAX_LEVERAGE = 3  # Maximum leverage allowed
-STOP_LOSS_PERCENTAGE = 0.02  # 2% stop loss
-TAKE_PROFIT_PERCENTAGE = 0.04  # 4% take profit
+@lru_cache()
+def get_config() -> SimpleNamespace:
+    """
+    Read settings from the environment once and cache the result.
+    Values from .env are loaded first, since agents read settings at import time,
+    before entry points get to call load_dotenv themselves.
 
-# Rate limits
-BINANCE_RATE_LIMIT = 1200  # requests per minute
-ALPACA_RATE_LIMIT = 200  # requests per minute
-AI_RATE_LIMIT = 60  # requests per minute
+    Returns:
+        SimpleNamespace with typed configuration values
+    """
+    load_dotenv()
+    env = os.environ
+    return SimpleNamespace(
+        # API credentials and endpoints
+        BINANCE_API_KEY=env.get("BINANCE_API_KEY", ""),
+        BINANCE_API_SECRET=env.get("BINANCE_API_SECRET", ""),
+        ALPACA_API_KEY=env.get("ALPACA_API_KEY", ""),
+        ALPACA_API_SECRET=env.get("ALPACA_API_SECRET", ""),
+        ALPACA_BASE_URL=env.get("ALPACA_BASE_URL", "https://paper-api.alpaca.markets"),
+        AZURE_OPENAI_ENDPOINT=env.get("AZURE_OPENAI_ENDPOINT", ""),
+        AZURE_OPENAI_KEY=env.get("AZURE_OPENAI_KEY", env.get("AZURE_OPENAI_API_KEY", "")),
+        AZURE_OPENAI_DEPLOYMENT=env.get("AZURE_OPENAI_DEPLOYMENT", "gpt-4-llamav2"),
+        GEMINI_API_KEY=env.get("GEMINI_API_KEY", ""),
 
-# Fallback settings
-MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds 
\ No newline at end of file
+        # Trading settings
+        MAX_POSITION_SIZE=float(env.get("MAX_POSITION_SIZE", 1000)),  # Maximum position size in USD
+        MAX_LEVERAGE=int(env.get("MAX_LEVERAGE", 3)),  # Maximum leverage allowed
+        STOP_LOSS_PERCENTAGE=float(env.get("STOP_LOSS_PERCENTAGE", 0.02)),  # 2% stop loss
+        TAKE_PROFIT_PERCENTAGE=float(env.get("TAKE_PROFIT_PERCENTAGE", 0.04)),  # 4% take profit
+
+        # Rate limits
+        BINANCE_RATE_LIMIT=int(env.get("BINANCE_RATE_LIMIT", 1200)),  # requests per minute
+        ALPACA_RATE_LIMIT=int(env.get("ALPACA_RATE_LIMIT", 200)),  # requests per minute
+        AI_RATE_LIMIT=int(env.get("AI_RATE_LIMIT", 60)),  # requests per minute
+
+        # Fallback settings
+        MAX_RETRIES=int(env.get("MAX_RETRIES", 3)),
+        RETRY_DELAY=int(env.get("RETRY_DELAY", 5)),  # seconds
+    )
+
+def __getattr__(name):
+    # Expose settings as module constants, e.g. ``from config import BINANCE_API_KEY``
+    try:
+        return getattr(get_config(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
\ No newline at end of file
@@ -52,13 +52,11 @@ def generate_sample_data(days=30, interval='1h'):
     returns = np.random.normal(0, volatility/np.sqrt(24 if interval == '1h' else 6 if interval == '4h' else 1), intervals)
     prices = base_price * (1 + returns).cumprod()
     
-    # Add some Fibonacci-like patterns
-    for i in range(0, intervals, 20):
-        if i + 20 < intervals:
-            # Create a swing high
-            prices[i+10] = prices[i+10] * 1.05
-            # Create a swing low
-            prices[i+15] = prices[i+15] * 0.95
+    # Add some Fibonacci-like patterns: a swing high and a swing low
+    # in every complete 20-bar window
+    window_starts = np.arange(0, intervals - 20, 20)
+    prices[window_starts + 10] *= 1.05
+    prices[window_starts + 15] *= 0.95
     
     # Generate OHLCV data
     data = []
@@ -1,15 +1,21 @@
+import asyncio
 import requests
+import threading
 import time
 import json
+from collections import deque
 from datetime import datetime
 import os
 from utils.logger import logger
 
 class PriceFeedClient:
-    def __init__(self, base_url="http://localhost:3000"):
+    def __init__(self, base_url="http://localhost:3000", history_size=86400):
         self.base_url = base_url
-        self.price_history = []
+        # Bounded ring of (epoch_seconds, price) tuples
+        self.price_history = deque(maxlen=history_size)
         self.callbacks = []
+        # Per-symbol stop signals for running monitors
+        self._stop_events = {}
         
     def get_current_price(self):
         """
@@ -59,8 +65,9 @@ class PriceFeedClient:
         """
         logger.info(f"Starting price monitoring for {symbol} with threshold {threshold}")
         
+        stop_event = self._stop_events[symbol] = threading.Event()
         try:
-            while True:
+            while not stop_event.is_set():
                 price = self.get_current_price()
                 
                 if price is not None:
@@ -73,25 +80,73 @@ class PriceFeedClient:
                         for callback in self.callbacks:
                             callback(symbol, price, result)
                 
-                time.sleep(interval)
+                stop_event.wait(interval)
+            logger.info(f"Price monitoring stopped for {symbol}")
         except KeyboardInterrupt:
             logger.info("Price monitoring stopped")
     
+    async def monitor(self, symbol, threshold, interval=5):
+        """
+        Coroutine version of start_monitoring for use on an asyncio event loop.
+        Blocking HTTP calls run in the loop's executor so many symbols can share one loop.
+        """
+        logger.info(f"Starting price monitoring for {symbol} with threshold {threshold}")
+        
+        loop = asyncio.get_running_loop()
+        stop_event = self._stop_events[symbol] = threading.Event()
+        try:
+            while not stop_event.is_set():
+                price = await loop.run_in_executor(None, self.get_current_price)
+                
+                if price is not None:
+                    # Check if price crosses threshold
+                    if price > threshold:
+                        logger.info(f"Price {price} exceeded threshold {threshold} for {symbol}")
+                        result = await loop.run_in_executor(None, self.analyze_price, symbol, threshold)
+                        
+                        # Notify callbacks
+                        for callback in self.callbacks:
+                            callback(symbol, price, result)
+                
+                await asyncio.sleep(interval)
+            logger.info(f"Price monitoring stopped for {symbol}")
+        except asyncio.CancelledError:
+            logger.info(f"Price monitoring stopped for {symbol}")
+            raise
+    
+    def stop_monitoring(self, symbol):
+        """
+        Signal the monitor for a symbol to stop
+        """
+        stop_event = self._stop_events.pop(symbol, None)
+        if stop_event is not None:
+            stop_event.set()
+    
     def add_callback(self, callback):
         """
         Add a callback function to be called when price analysis is triggered
         """
-        self.callbacks.append(callback)
+        if callback not in self.callbacks:
+            self.callbacks.append(callback)
+    
+    def get_price_history(self):
+        """
+        Return the recorded price history as a list of {timestamp, price} dicts
+        """
+        return [
+            {"timestamp": datetime.fromtimestamp(ts).isoformat(), "price": price}
+            for ts, price in self.price_history
+        ]
     
     def _log_price(self, price):
         """
         Log price to history and file
         """
-        timestamp = datetime.now().isoformat()
-        self.price_history.append({"timestamp": timestamp, "price": price})
+        timestamp = time.time()
+        self.price_history.append((timestamp, price))
         
         # Save to CSV file
-        self._save_to_csv(timestamp, price)
+        self._save_to_csv(datetime.fromtimestamp(timestamp).isoformat(), price)
     
     def _save_to_csv(self, timestamp, price):
         """
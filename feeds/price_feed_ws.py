@@ -0,0 +1,52 @@
+import asyncio
+from typing import Callable, Iterable
+import aiohttp
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+from utils.logger import logger
+from utils.data_models import PriceUpdate
+
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream"
+
+async def stream_prices(symbols: Iterable[str], callback: Callable[[PriceUpdate], None],
+                        url: str = BINANCE_STREAM_URL, reconnect_delay: float = 5):
+    """
+    Stream ticker prices for the given symbols straight from the exchange
+    WebSocket and pass each one to the callback on the event loop.
+    Reconnects after errors until the task is cancelled.
+    
+    Args:
+        symbols: Exchange symbols to subscribe to, e.g. 'BTCUSDT'
+        callback: Called with a PriceUpdate for every ticker message
+        url: Combined-stream endpoint of the exchange
+        reconnect_delay: Seconds to wait before reconnecting after an error
+    """
+    streams = "/".join(f"{symbol.lower()}@ticker" for symbol in symbols)
+    stream_url = f"{url}?streams={streams}"
+    
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.ws_connect(stream_url, heartbeat=30) as ws:
+                    logger.info(f"Connected to price stream for {streams}")
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            if msg.type == aiohttp.WSMsgType.ERROR:
+                                raise ws.exception()
+                            continue
+                        
+                        ticker = json_loads(msg.data)["data"]
+                        callback(PriceUpdate(
+                            symbol=ticker["s"],
+                            price=float(ticker["c"]),
+                            timestamp=ticker["E"],
+                            source="binance",
+                            volume=float(ticker["v"])
+                        ))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Price stream error: {e}")
+            await asyncio.sleep(reconnect_delay)
@@ -1,18 +1,46 @@
+import asyncio
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from feeds.price_feed_client import PriceFeedClient
+from feeds.spsc_ring import SPSCRing
 from ai_agents.parent_agent import ParentAgent
 from utils.logger import logger
 
+DEFAULT_THRESHOLD = 1000
+
 class SignalProcessor:
     def __init__(self, parent_agent, symbols=None, thresholds=None):
         self.parent_agent = parent_agent
         self.symbols = symbols or ["BTC", "ETH", "EUR/USD"]
         self.thresholds = thresholds or {"BTC": 1050, "ETH": 2000, "EUR/USD": 1.1}
         self.price_feed = PriceFeedClient()
-        self.monitoring_threads = {}
         self.running = False
         
+        # Register the analysis callback once; it is shared by every symbol monitor
+        self.price_feed.add_callback(self._handle_price_analysis)
+        
+        # Symbols are interned to integer IDs indexing a flat threshold array,
+        # and each symbol has one market data dict that is reused on every tick
+        self._symbol_ids = {}
+        self._market_data = {}
+        self._threshold_values = np.full(64, DEFAULT_THRESHOLD, dtype=np.float64)
+        for symbol in self.symbols:
+            self._register_symbol(symbol, self.thresholds.get(symbol, DEFAULT_THRESHOLD))
+        
+        # All symbol monitors run as tasks on a single event loop in one thread
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = None
+        self._executor = None
+        self._tasks = {}
+        
+        # Price analyses are handed from the feed to a single consumer thread
+        # so slow AI analysis never blocks the feed
+        self._ring = SPSCRing(1024)
+        self._consumer_thread = None
+        
     def start(self):
         """
         Start monitoring all symbols
@@ -20,56 +48,106 @@ class SignalProcessor:
         self.running = True
         logger.info("Starting signal processor")
         
-        # Start monitoring each symbol in a separate thread
+        # Start the consumer that feeds the parent agent
+        self._consumer_thread = threading.Thread(target=self._consume, daemon=True)
+        self._consumer_thread.start()
+        
+        # Blocking feed requests run on a bounded pool rather than one thread per symbol
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 2),
+            thread_name_prefix='sig'
+        )
+        self._loop.set_default_executor(self._executor)
+        
+        # Run the event loop in a dedicated thread
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
+        # Schedule a monitoring task for each symbol
         for symbol in self.symbols:
-            threshold = self.thresholds.get(symbol, 1000)
-            thread = threading.Thread(
-                target=self._monitor_symbol,
-                args=(symbol, threshold),
-                daemon=True
-            )
-            self.monitoring_threads[symbol] = thread
-            thread.start()
-            logger.info(f"Started monitoring thread for {symbol}")
+            self._start_monitor(symbol, self.thresholds.get(symbol, DEFAULT_THRESHOLD))
             
     def stop(self):
         """
-        Stop all monitoring threads
+        Stop all monitoring tasks and the event loop
         """
         self.running = False
         logger.info("Stopping signal processor")
         
-        # Wait for all threads to finish
-        for symbol, thread in self.monitoring_threads.items():
-            thread.join(timeout=5)
-            logger.info(f"Stopped monitoring thread for {symbol}")
+        # Stop the feed for each symbol and cancel its monitoring task
+        for symbol, task in self._tasks.items():
+            self.price_feed.stop_monitoring(symbol)
+            task.cancel()
+            logger.info(f"Stopped monitoring task for {symbol}")
+        self._tasks.clear()
+        
+        # Stop the event loop and wait for its thread to exit
+        if self._loop_thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+            self._loop_thread = None
+            
+        # Drop queued feed requests; in-flight HTTP calls are not waited on
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            
+        # Wake and wait for the consumer
+        if self._consumer_thread is not None:
+            self._ring.wake()
+            self._consumer_thread.join(timeout=5)
+            self._consumer_thread = None
             
-    def _monitor_symbol(self, symbol, threshold):
+    def _start_monitor(self, symbol, threshold):
+        """
+        Schedule the monitoring coroutine for a symbol on the event loop
+        """
+        self._tasks[symbol] = asyncio.run_coroutine_threadsafe(
+            self._monitor_symbol(symbol, threshold), self._loop
+        )
+        logger.info(f"Started monitoring task for {symbol}")
+        
+    async def _monitor_symbol(self, symbol, threshold):
         """
         Monitor a specific symbol and trigger AI analysis when threshold is crossed
         """
         logger.info(f"Monitoring {symbol} with threshold {threshold}")
         
-        # Add callback for price analysis
-        self.price_feed.add_callback(self._handle_price_analysis)
-        
         # Start monitoring
-        self.price_feed.start_monitoring(symbol, threshold)
+        await self.price_feed.monitor(symbol, threshold)
         
     def _handle_price_analysis(self, symbol, price, analysis_result):
+        """
+        Queue a price analysis result for the consumer thread
+        """
+        if not self._ring.push((symbol, price, analysis_result)):
+            logger.warning(f"Signal queue full, dropping price analysis for {symbol}")
+            
+    def _consume(self):
+        """
+        Drain queued price analyses and hand them to the parent agent
+        """
+        while self.running:
+            item = self._ring.pop()
+            if item is None:
+                self._ring.wait(timeout=1)
+                continue
+            try:
+                self._process_price_analysis(*item)
+            except Exception as e:
+                logger.error(f"Error processing price analysis: {e}")
+                
+    def _process_price_analysis(self, symbol, price, analysis_result):
         """
         Handle price analysis result and trigger AI agent
         """
         logger.info(f"Price analysis for {symbol}: {analysis_result}")
         
-        # Create market data for AI agent
-        market_data = {
-            'symbol': symbol,
-            'price': price,
-            'analysis': analysis_result,
-            'volatility': 0.03,  # Example value
-            'trend': 'bullish' if price > self.thresholds.get(symbol, 1000) else 'bearish'
-        }
+        # Update the symbol's market data for the AI agent in place
+        market_data = self._market_data[symbol]
+        market_data['price'] = price
+        market_data['analysis'] = analysis_result
+        market_data['trend'] = 'bullish' if price > self._threshold_values[self._symbol_ids[symbol]] else 'bearish'
         
         # Trigger AI agent analysis
         self.parent_agent.analyze_and_delegate(market_data)
@@ -80,16 +158,11 @@ class SignalProcessor:
         """
         self.symbols.append(symbol)
         self.thresholds[symbol] = threshold
+        self._register_symbol(symbol, threshold)
         
         if self.running:
             # Start monitoring the new symbol
-            thread = threading.Thread(
-                target=self._monitor_symbol,
-                args=(symbol, threshold),
-                daemon=True
-            )
-            self.monitoring_threads[symbol] = thread
-            thread.start()
+            self._start_monitor(symbol, threshold)
             logger.info(f"Added monitoring for {symbol}")
             
     def remove_symbol(self, symbol):
@@ -100,4 +173,33 @@ class SignalProcessor:
             self.symbols.remove(symbol)
             if symbol in self.thresholds:
                 del self.thresholds[symbol]
-            logger.info(f"Removed monitoring for {symbol}") 
\ No newline at end of file
+            self._threshold_values[self._symbol_ids[symbol]] = DEFAULT_THRESHOLD
+            self.price_feed.stop_monitoring(symbol)
+            task = self._tasks.pop(symbol, None)
+            if task is not None:
+                task.cancel()
+            logger.info(f"Removed monitoring for {symbol}") 
+            
+    def _register_symbol(self, symbol, threshold):
+        """
+        Assign an integer ID to a symbol and store its threshold
+        """
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbol_ids)
+            if symbol_id == len(self._threshold_values):
+                # Grow the threshold array geometrically
+                self._threshold_values = np.concatenate([
+                    self._threshold_values,
+                    np.full(len(self._threshold_values), DEFAULT_THRESHOLD, dtype=np.float64)
+                ])
+            self._symbol_ids[symbol] = symbol_id
+            self._market_data[symbol] = {
+                'symbol': symbol,
+                'price': 0.0,
+                'analysis': None,
+                'volatility': 0.03,  # Example value
+                'trend': ''
+            }
+        self._threshold_values[symbol_id] = threshold
+        return symbol_id
\ No newline at end of file
@@ -0,0 +1,88 @@
+import ctypes
+import threading
+
+CACHE_LINE_SIZE = 64
+
+class _RingIndices(ctypes.Structure):
+    """
+    Head and tail counters, each padded out to its own cache line so the
+    producer and consumer never write to the same line.
+    """
+    _fields_ = [
+        ('head', ctypes.c_uint64),
+        ('_pad1', ctypes.c_ubyte * (CACHE_LINE_SIZE - ctypes.sizeof(ctypes.c_uint64))),
+        ('tail', ctypes.c_uint64),
+        ('_pad2', ctypes.c_ubyte * (CACHE_LINE_SIZE - ctypes.sizeof(ctypes.c_uint64))),
+    ]
+
+def _aligned_indices():
+    """
+    Allocate a _RingIndices structure aligned to a cache-line boundary
+    """
+    raw = (ctypes.c_ubyte * (ctypes.sizeof(_RingIndices) + CACHE_LINE_SIZE))()
+    offset = -ctypes.addressof(raw) % CACHE_LINE_SIZE
+    indices = _RingIndices.from_buffer(raw, offset)
+    return raw, indices
+
+class SPSCRing:
+    """
+    Fixed-size single-producer/single-consumer ring buffer.
+    
+    The producer only advances the tail and the consumer only advances the head,
+    so neither side takes a lock. A threading.Event nudges a waiting consumer.
+    """
+    
+    def __init__(self, capacity=1024):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self._mask = capacity - 1
+        self._slots = [None] * capacity
+        # head: next slot to read, written by the consumer only
+        # tail: next slot to write, written by the producer only
+        self._raw, self._indices = _aligned_indices()
+        self._nudge = threading.Event()
+        
+    def push(self, item):
+        """
+        Add an item to the ring (producer side).
+        Returns False without blocking if the ring is full.
+        """
+        indices = self._indices
+        tail = indices.tail
+        if tail - indices.head > self._mask:
+            return False
+        self._slots[tail & self._mask] = item
+        indices.tail = tail + 1
+        self._nudge.set()
+        return True
+        
+    def pop(self):
+        """
+        Remove and return the oldest item (consumer side), or None if the ring is empty
+        """
+        indices = self._indices
+        head = indices.head
+        if head == indices.tail:
+            return None
+        index = head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        indices.head = head + 1
+        return item
+        
+    def wait(self, timeout=None):
+        """
+        Block the consumer until the producer pushes an item or the timeout expires
+        """
+        self._nudge.clear()
+        if self._indices.head == self._indices.tail:
+            self._nudge.wait(timeout)
+            
+    def wake(self):
+        """
+        Wake a waiting consumer without pushing an item
+        """
+        self._nudge.set()
+        
+    def __len__(self):
+        return self._indices.tail - self._indices.head
\ No newline at end of file
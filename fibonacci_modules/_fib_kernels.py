@@ -0,0 +1,220 @@
+"""
+Numba-compiled kernels for Fibonacci level calculations.
+
+Numba is optional: without it the kernels run as plain Python/NumPy functions.
+"""
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Warm-up threads keyed by the warm-up function they run
+_warm_up_threads = {}
+_warm_up_lock = threading.Lock()
+
+
+@njit(cache=True)
+def fib_levels(start_price, end_price, ratios, ext_ratios, use_ext):
+    """
+    Calculate Fibonacci retracement and extension levels.
+    
+    Args:
+        start_price: Starting price for the Fibonacci calculation
+        end_price: Ending price for the Fibonacci calculation
+        ratios: float64 array of retracement ratios
+        ext_ratios: float64 array of extension ratios
+        use_ext: Whether to calculate extension levels
+        
+    Returns:
+        Tuple of (support, resistance) float64 arrays
+    """
+    price_range = end_price - start_price
+    
+    retracement = np.empty(ratios.shape[0])
+    for i in range(ratios.shape[0]):
+        retracement[i] = start_price + price_range * ratios[i]
+        
+    n_ext = ext_ratios.shape[0] if use_ext else 0
+    extension = np.empty(n_ext)
+    for i in range(n_ext):
+        extension[i] = start_price + price_range * ext_ratios[i]
+        
+    if end_price > start_price:
+        return retracement, extension
+    return extension, retracement
+
+
+@njit(cache=True)
+def nearest_brackets(support_levels, resistance_levels, price):
+    """
+    Find the nearest support below and the nearest resistance above a price
+    using binary search.
+    
+    Args:
+        support_levels: Non-empty, ascending float64 array of support levels
+        resistance_levels: Non-empty, ascending float64 array of resistance levels
+        price: Current market price
+        
+    Returns:
+        Tuple of (nearest_support, nearest_resistance). Falls back to the lowest
+        support / highest resistance when no level brackets the price.
+    """
+    i = np.searchsorted(support_levels, price)
+    nearest_support = support_levels[i - 1] if i > 0 else support_levels[0]
+    
+    j = np.searchsorted(resistance_levels, price, side='right')
+    if j < resistance_levels.shape[0]:
+        nearest_resistance = resistance_levels[j]
+    else:
+        nearest_resistance = resistance_levels[-1]
+        
+    return nearest_support, nearest_resistance
+
+
+@njit(cache=True, boundscheck=False)
+def fused_reduce(high, low, close):
+    """
+    Compute the price aggregates used by the ensemble strategies in a single
+    pass over the series.
+    
+    Args:
+        high: Non-empty float64 array of high prices
+        low: float64 array of low prices, same length as high
+        close: float64 array of close prices, same length as high
+        
+    Returns:
+        Tuple of (high_max, low_min, close_peak, close_trough,
+        high_mean20, low_mean20, sma10) over the full series and its last 20 / 10 bars
+    """
+    n = high.shape[0]
+    start20 = max(0, n - 20)
+    start10 = max(0, n - 10)
+    
+    high_max = high[0]
+    low_min = low[0]
+    close_peak = close[0]
+    close_trough = close[0]
+    high_sum20 = 0.0
+    low_sum20 = 0.0
+    close_sum10 = 0.0
+    for i in range(n):
+        h = high[i]
+        l = low[i]
+        c = close[i]
+        if h > high_max:
+            high_max = h
+        if l < low_min:
+            low_min = l
+        if c > close_peak:
+            close_peak = c
+        if c < close_trough:
+            close_trough = c
+        if i >= start20:
+            high_sum20 += h
+            low_sum20 += l
+            if i >= start10:
+                close_sum10 += c
+                
+    return (high_max, low_min, close_peak, close_trough,
+            high_sum20 / (n - start20), low_sum20 / (n - start20), close_sum10 / (n - start10))
+
+
+@njit(cache=True)
+def ensemble_levels(high, low, close, ratios):
+    """
+    Calculate the support and resistance levels of every ensemble strategy.
+    
+    Strategy i places support at ``base[i] + ratios[i] * (top[i] - base[i])`` and
+    resistance at ``top[i] - ratios[i] * (top[i] - base[i])``; see
+    EnsembleFibonacciAdapter for the base/top pair each strategy uses.
+    
+    Args:
+        high: Non-empty float64 array of high prices
+        low: float64 array of low prices, same length as high
+        close: float64 array of close prices, same length as high
+        ratios: float64 array of the 7 strategy ratios
+        
+    Returns:
+        Tuple of (ensemble_support, ensemble_resistance, support_levels, resistance_levels)
+    """
+    high_max, low_min, close_peak, close_trough, high_mean20, low_mean20, sma10 = fused_reduce(high, low, close)
+    
+    bases = np.array([low_min, low_min, close_trough, low_min, low_mean20, sma10 * 0.95, low_min])
+    tops = np.array([high_max, high_max, close_peak, high_max, high_mean20, sma10 * 1.05, high_max])
+    offsets = ratios * (tops - bases)
+    support_levels = bases + offsets
+    resistance_levels = tops - offsets
+    
+    return support_levels.mean(), resistance_levels.mean(), support_levels, resistance_levels
+
+
+@njit(cache=True)
+def ensemble_levels_batch(high, low, close, ratios):
+    """
+    Calculate the ensemble support and resistance for a batch of price windows.
+    
+    Args:
+        high: 2-D float64 array of high prices, one window per row
+        low: 2-D float64 array of low prices, same shape as high
+        close: 2-D float64 array of close prices, same shape as high
+        ratios: float64 array of the 7 strategy ratios
+        
+    Returns:
+        Tuple of (ensemble_support, ensemble_resistance) arrays, one value per window
+    """
+    m = high.shape[0]
+    support = np.empty(m)
+    resistance = np.empty(m)
+    for i in range(m):
+        support[i], resistance[i], _, _ = ensemble_levels(high[i], low[i], close[i], ratios)
+    return support, resistance
+
+
+def warm_up():
+    """
+    Compile every kernel, or load it from numba's on-disk cache, by calling it
+    once on tiny inputs so the first real tick does not pay for it.
+    """
+    prices = np.array([1.0, 2.0, 3.0, 2.0, 1.0])
+    ratios = np.zeros(7)
+    # The ensemble adapter passes its ratios as a read-only class constant
+    frozen_ratios = np.zeros(7)
+    frozen_ratios.flags.writeable = False
+    
+    fib_levels(1.0, 2.0, ratios, ratios, True)
+    nearest_brackets(prices, prices, 2.0)
+    nearest_brackets(prices.astype(np.float32), prices.astype(np.float32), 2.0)
+    ensemble_levels(prices, prices, prices, frozen_ratios)
+    ensemble_levels_batch(prices.reshape(1, -1), prices.reshape(1, -1), prices.reshape(1, -1), frozen_ratios)
+
+
+def warm_up_in_background(warm_up_fn=warm_up):
+    """
+    Start a warm-up function on a daemon thread, once per process and function.
+    Calls that reach a kernel before it is ready wait for numba's compilation to finish.
+    
+    Args:
+        warm_up_fn: Function that calls the kernels to compile on tiny inputs
+    
+    Returns:
+        The warm-up thread, or None if numba is not installed
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    with _warm_up_lock:
+        thread = _warm_up_threads.get(warm_up_fn)
+        if thread is None:
+            thread = threading.Thread(target=warm_up_fn, name='fib-kernel-warm-up', daemon=True)
+            _warm_up_threads[warm_up_fn] = thread
+            thread.start()
+    return thread
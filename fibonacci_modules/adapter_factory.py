@@ -1,10 +1,120 @@
 import os
+import copy
 import json
 import importlib
-from typing import Dict, Any, List, Optional
+import logging
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 
 # Import the base adapter
-from base_adapter import FibonacciBaseAdapter
+try:
+    from .base_adapter import BaseFibonacciAdapter
+except ImportError:  # loaded as a top-level module, e.g. by test_ensemble
+    from base_adapter import BaseFibonacciAdapter
+
+logger = logging.getLogger(__name__)
+
+# Entry point group that installed packages can use to register adapters
+ADAPTER_ENTRY_POINT_GROUP = 'fibonacci_modules.adapters'
+
+# Parsed configs keyed by (path, mtime_ns, size), so an edited file is re-read
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+def _read_config(config_path: str) -> Dict[str, Any]:
+    """
+    Parse a configuration file, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        A private copy of the parsed configuration
+    """
+    st = os.stat(config_path)
+    cache_key = (config_path, st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(cache_key)
+    if config is None:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        _CONFIG_CACHE[cache_key] = config
+    return copy.deepcopy(config)
+
+# Resolved adapter classes, keyed by module name
+_ADAPTER_CLASS_CACHE: Dict[str, type] = {}
+
+# Integer codes for signal actions used by the vote accumulators
+_ACTION_ID = {'BUY': 0, 'SELL': 1, 'HOLD': 2}
+_ACTION_NAME = ('BUY', 'SELL', 'HOLD')
+
+def _adapter_signal(adapter: BaseFibonacciAdapter, price_data: Dict[str, Any],
+                    levels: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Get an adapter's signal, handing it levels it already computed for the same price data.
+    
+    Args:
+        adapter: Adapter to query
+        price_data: Dictionary containing price information
+        levels: The adapter's levels for price_data, if already computed
+        
+    Returns:
+        Dictionary containing signal information
+    """
+    if levels is None:
+        return adapter.get_signal(price_data)
+    return adapter.get_signal(price_data, levels=levels)
+
+@lru_cache()
+def _registered_adapters() -> Dict[str, Any]:
+    """
+    Get adapter entry points registered under ADAPTER_ENTRY_POINT_GROUP.
+    
+    Returns:
+        Dictionary mapping adapter names to entry points
+    """
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=ADAPTER_ENTRY_POINT_GROUP)
+    else:  # Python < 3.10 returns a dict of groups
+        eps = eps.get(ADAPTER_ENTRY_POINT_GROUP, [])
+    return {ep.name: ep for ep in eps}
+
+def _resolve_adapter_class(module_name: str, module_path: str) -> Optional[type]:
+    """
+    Resolve the adapter class for an enabled module.
+    Registered entry points take precedence over importing the module path.
+    
+    Args:
+        module_name: Name of the adapter module
+        module_path: Import path of the adapter module
+        
+    Returns:
+        The adapter class, or None if the module does not define one
+    """
+    adapter_class = _ADAPTER_CLASS_CACHE.get(module_name)
+    if adapter_class is not None:
+        return adapter_class
+    
+    entry_point = _registered_adapters().get(module_name)
+    if entry_point is not None:
+        adapter_class = entry_point.load()
+    else:
+        # Import the module
+        module = importlib.import_module(module_path)
+        
+        # Prefer the declared adapter class, falling back to scanning the module
+        adapter_class = getattr(module, 'ADAPTER_CLASS', None)
+        if adapter_class is None:
+            for item_name in dir(module):
+                item = getattr(module, item_name)
+                if isinstance(item, type) and issubclass(item, BaseFibonacciAdapter) and item != BaseFibonacciAdapter:
+                    adapter_class = item
+                    break
+    
+    if adapter_class:
+        _ADAPTER_CLASS_CACHE[module_name] = adapter_class
+    return adapter_class
 
 class FibonacciAdapterFactory:
     """
@@ -26,8 +136,9 @@ class FibonacciAdapterFactory:
         # Load configuration
         self.config = self._load_config(config_path)
         
-        # Initialize adapters
-        self.adapters = self._initialize_adapters()
+        # Adapters are imported and instantiated on first use
+        self._adapter_specs = self._initialize_adapters()
+        self._adapters: Dict[str, BaseFibonacciAdapter] = {}
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -40,10 +151,9 @@ class FibonacciAdapterFactory:
             Dictionary containing configuration
         """
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _read_config(config_path)
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             # Return default configuration
             return {
                 'enabled_modules': ['repo1', 'repo2', 'repo3'],
@@ -53,46 +163,72 @@ class FibonacciAdapterFactory:
                 'default_symbol': 'BTC'
             }
     
-    def _initialize_adapters(self) -> Dict[str, FibonacciBaseAdapter]:
+    def _initialize_adapters(self) -> Dict[str, str]:
+        """
+        Collect the adapters enabled in the configuration without importing them.
+        
+        Returns:
+            Dictionary mapping adapter names to adapter module paths
+        """
+        return {
+            module_name: f"fibonacci_modules.{module_name}.adapter"
+            for module_name in self.config.get('enabled_modules', [])
+        }
+    
+    def _get(self, name: str) -> Optional[BaseFibonacciAdapter]:
         """
-        Initialize adapters based on configuration.
+        Get an adapter instance, importing and instantiating it on first access.
+        Adapters that fail to load are dropped from the enabled set.
         
+        Args:
+            name: Name of the adapter
+            
         Returns:
-            Dictionary mapping adapter names to adapter instances
+            The adapter instance, or None if it is not enabled or failed to load
         """
-        adapters = {}
+        adapter = self._adapters.get(name)
+        if adapter is not None:
+            return adapter
         
-        # Get the directory of this file
-        base_dir = os.path.dirname(os.path.abspath(__file__))
+        module_path = self._adapter_specs.get(name)
+        if module_path is None:
+            return None
         
-        # Initialize each enabled adapter
-        for module_name in self.config.get('enabled_modules', []):
-            try:
-                # Construct the module path
-                module_path = f"fibonacci_modules.{module_name}.adapter"
-                
-                # Import the module
-                module = importlib.import_module(module_path)
-                
-                # Get the adapter class (assuming it's the only class in the module)
-                adapter_class = None
-                for item_name in dir(module):
-                    item = getattr(module, item_name)
-                    if isinstance(item, type) and issubclass(item, FibonacciBaseAdapter) and item != FibonacciBaseAdapter:
-                        adapter_class = item
-                        break
-                
-                if adapter_class:
-                    # Create an instance of the adapter
-                    adapter = adapter_class()
-                    adapters[module_name] = adapter
-                else:
-                    print(f"No adapter class found in module {module_name}")
+        try:
+            adapter_class = _resolve_adapter_class(name, module_path)
+            
+            if adapter_class:
+                # Create an instance of the adapter with its section of the configuration
+                adapter = adapter_class(self.config.get(name, {}))
+                self._adapters[name] = adapter
+                return adapter
             
-            except (ImportError, AttributeError) as e:
-                print(f"Error initializing adapter {module_name}: {e}")
+            logger.error("No adapter class found in module %s", name)
+        
+        except (ImportError, AttributeError) as e:
+            logger.error("Error initializing adapter %s: %s", name, e)
         
-        return adapters
+        del self._adapter_specs[name]
+        return None
+    
+    def _iter_adapters(self):
+        """
+        Iterate over the enabled adapters, loading each one on first access.
+        
+        Yields:
+            Tuples of (adapter name, adapter instance)
+        """
+        for name in list(self._adapter_specs):
+            adapter = self._get(name)
+            if adapter is not None:
+                yield name, adapter
+    
+    @property
+    def adapters(self) -> Dict[str, BaseFibonacciAdapter]:
+        """
+        All enabled adapters, loading any that have not been used yet.
+        """
+        return dict(self._iter_adapters())
     
     def get_levels(self, price_data: Dict[str, Any], adapter_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -107,104 +243,219 @@ class FibonacciAdapterFactory:
         """
         if adapter_name:
             # Get levels from specific adapter
-            if adapter_name in self.adapters:
-                return self.adapters[adapter_name].get_levels(price_data)
+            adapter = self._get(adapter_name)
+            if adapter is not None:
+                return adapter.get_levels(price_data)
             else:
-                print(f"Adapter {adapter_name} not found")
+                logger.debug("Adapter %s not found", adapter_name)
                 return {}
         
-        # Aggregate levels from all adapters
+        return self.get_all_levels(price_data)
+    
+    def get_nearest_levels(self, price_data: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        """
+        Get only the nearest support and resistance levels across all adapters.
+        Cheaper than get_all_levels since the combined level lists are never deduplicated or sorted.
+        
+        Args:
+            price_data: Dictionary containing price information
+            
+        Returns:
+            Dictionary with the nearest 'support' and 'resistance' levels (None if there is none)
+        """
+        current_price = self._current_price(price_data)
+        nearest_support = None
+        nearest_resistance = None
+        
+        for _, adapter in self._iter_adapters():
+            levels = adapter.get_levels(price_data)
+            
+            support = max(
+                (level for level in levels.get('support_levels', ())
+                 if current_price is None or level < current_price),
+                default=None
+            )
+            if support is not None and (nearest_support is None or support > nearest_support):
+                nearest_support = support
+            
+            resistance = min(
+                (level for level in levels.get('resistance_levels', ())
+                 if current_price is None or level > current_price),
+                default=None
+            )
+            if resistance is not None and (nearest_resistance is None or resistance < nearest_resistance):
+                nearest_resistance = resistance
+        
+        return {
+            'support': None if nearest_support is None else float(nearest_support),
+            'resistance': None if nearest_resistance is None else float(nearest_resistance)
+        }
+    
+    def get_all_levels(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aggregate Fibonacci levels from all adapters.
+        
+        Args:
+            price_data: Dictionary containing price information
+            
+        Returns:
+            Dictionary containing the nearest levels, the combined sorted level lists
+            and each adapter's levels
+        """
         all_levels = {}
-        for name, adapter in self.adapters.items():
+        for name, adapter in self._iter_adapters():
             levels = adapter.get_levels(price_data)
             all_levels[name] = levels
         
         # Aggregate support and resistance levels
-        support_levels = []
-        resistance_levels = []
+        support_arrays = [np.empty(0)]
+        resistance_arrays = [np.empty(0)]
         
         for levels in all_levels.values():
             if 'support_levels' in levels:
-                support_levels.extend(levels['support_levels'])
+                support_arrays.append(np.asarray(levels['support_levels'], dtype=np.float64))
             if 'resistance_levels' in levels:
-                resistance_levels.extend(levels['resistance_levels'])
+                resistance_arrays.append(np.asarray(levels['resistance_levels'], dtype=np.float64))
         
-        # Remove duplicates and sort
-        support_levels = sorted(list(set(support_levels)), reverse=True)
-        resistance_levels = sorted(list(set(resistance_levels)))
+        # Remove duplicates and sort ascending
+        support = np.unique(np.concatenate(support_arrays))
+        resistance = np.unique(np.concatenate(resistance_arrays))
         
-        # Get nearest support and resistance
-        nearest_support = support_levels[0] if support_levels else None
-        nearest_resistance = resistance_levels[0] if resistance_levels else None
+        # Get nearest support below and nearest resistance above the current price
+        current_price = self._current_price(price_data)
+        if current_price is None:
+            nearest_support = support[-1] if support.size else None
+            nearest_resistance = resistance[0] if resistance.size else None
+        else:
+            i = np.searchsorted(support, current_price) - 1
+            nearest_support = support[i] if i >= 0 else None
+            j = np.searchsorted(resistance, current_price, side='right')
+            nearest_resistance = resistance[j] if j < resistance.size else None
         
         return {
-            'support': nearest_support,
-            'resistance': nearest_resistance,
-            'support_levels': support_levels,
-            'resistance_levels': resistance_levels,
+            'support': None if nearest_support is None else float(nearest_support),
+            'resistance': None if nearest_resistance is None else float(nearest_resistance),
+            'support_levels': support[::-1].tolist(),
+            'resistance_levels': resistance.tolist(),
             'all_levels': all_levels
         }
     
-    def get_signal(self, price_data: Dict[str, Any], adapter_name: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _current_price(price_data: Dict[str, Any]) -> Optional[float]:
+        """
+        Get the current price from price data.
+        
+        Args:
+            price_data: Dictionary containing price information
+            
+        Returns:
+            Latest close price, or None if unavailable
+        """
+        close = price_data.get('close')
+        if close is None:
+            return None
+        if np.ndim(close):
+            return float(close[-1]) if len(close) else None
+        return float(close)
+    
+    def get_levels_and_signal(self, price_data: Dict[str, Any], adapter_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get Fibonacci levels and the trading signal for the same price data in one call.
+        Each adapter computes its levels once and reuses them for its signal.
+        
+        Args:
+            price_data: Dictionary containing price information
+            adapter_name: Name of the adapter to use. If None, aggregates from all adapters.
+            
+        Returns:
+            Dictionary with 'levels' and 'signal' keys
+        """
+        if adapter_name:
+            adapter = self._get(adapter_name)
+            if adapter is None:
+                logger.debug("Adapter %s not found", adapter_name)
+                return {'levels': {}, 'signal': {'action': 'HOLD', 'confidence': 0.0}}
+            levels = adapter.get_levels(price_data)
+            signal = _adapter_signal(adapter, price_data, levels)
+        else:
+            levels = self.get_all_levels(price_data)
+            signal = self.get_signal(price_data, adapter_levels=levels['all_levels'])
+        
+        return {
+            'levels': levels,
+            'signal': signal
+        }
+    
+    def get_signal(self, price_data: Dict[str, Any], adapter_name: Optional[str] = None,
+                   return_details: bool = False,
+                   adapter_levels: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get trading signal from a specific adapter or aggregate from all adapters.
         
         Args:
             price_data: Dictionary containing price information
             adapter_name: Name of the adapter to use. If None, aggregates from all adapters.
+            return_details: If True, include each adapter's signal under 'all_signals'
+            adapter_levels: Levels already computed for price_data, keyed by adapter name (optional)
             
         Returns:
             Dictionary containing signal information
         """
         if adapter_name:
             # Get signal from specific adapter
-            if adapter_name in self.adapters:
-                return self.adapters[adapter_name].get_signal(price_data)
+            adapter = self._get(adapter_name)
+            if adapter is not None:
+                return _adapter_signal(
+                    adapter, price_data, adapter_levels.get(adapter_name) if adapter_levels else None
+                )
             else:
-                print(f"Adapter {adapter_name} not found")
+                logger.debug("Adapter %s not found", adapter_name)
                 return {'action': 'HOLD', 'confidence': 0.0}
         
-        # Get signals from all adapters
-        signals = {}
-        for name, adapter in self.adapters.items():
-            signals[name] = adapter.get_signal(price_data)
-        
         # Aggregate signals based on configuration
         aggregation_method = self.config.get('aggregation_method', 'weighted_vote')
         
         if aggregation_method == 'weighted_vote':
-            # Count votes for each action
-            action_counts = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
-            total_confidence = 0
+            # Accumulate confidence per action in a single pass over the adapters
+            action_confidence = [0.0, 0.0, 0.0]
+            total_confidence = 0.0
+            signals = {} if return_details else None
             
-            for signal in signals.values():
-                action = signal.get('action', 'HOLD')
-                confidence = signal.get('confidence', 0.0)
+            for name, adapter in self._iter_adapters():
+                signal = _adapter_signal(adapter, price_data, adapter_levels.get(name) if adapter_levels else None)
+                if signals is not None:
+                    signals[name] = signal
                 
-                action_counts[action] += confidence
+                confidence = signal.get('confidence', 0.0)
+                action_confidence[_ACTION_ID.get(signal.get('action', 'HOLD'), 2)] += confidence
                 total_confidence += confidence
             
-            # Normalize confidence
+            # Get the action with the highest confidence and normalize it
+            best_index = max(range(3), key=action_confidence.__getitem__)
+            best_action = _ACTION_NAME[best_index]
+            best_confidence = action_confidence[best_index]
             if total_confidence > 0:
-                for action in action_counts:
-                    action_counts[action] /= total_confidence
-            
-            # Get the action with the highest confidence
-            best_action = max(action_counts, key=action_counts.get)
-            best_confidence = action_counts[best_action]
+                best_confidence /= total_confidence
             
             # Check if confidence meets threshold
             if best_confidence < self.config.get('confidence_threshold', 0.6):
                 best_action = 'HOLD'
                 best_confidence = 0.0
             
-            return {
+            result = {
                 'action': best_action,
-                'confidence': best_confidence,
-                'all_signals': signals
+                'confidence': best_confidence
             }
+            if return_details:
+                result['all_signals'] = signals
+            return result
+        
+        # Get signals from all adapters
+        signals = {}
+        for name, adapter in self._iter_adapters():
+            signals[name] = _adapter_signal(adapter, price_data, adapter_levels.get(name) if adapter_levels else None)
         
-        elif aggregation_method == 'highest_confidence':
+        if aggregation_method == 'highest_confidence':
             # Find the signal with the highest confidence
             best_signal = {'action': 'HOLD', 'confidence': 0.0}
             
@@ -216,25 +467,26 @@ class FibonacciAdapterFactory:
             if best_signal.get('confidence', 0.0) < self.config.get('confidence_threshold', 0.6):
                 best_signal = {'action': 'HOLD', 'confidence': 0.0}
             
-            return {
+            result = {
                 'action': best_signal.get('action', 'HOLD'),
-                'confidence': best_signal.get('confidence', 0.0),
-                'all_signals': signals
+                'confidence': best_signal.get('confidence', 0.0)
             }
         
         else:
             # Default to simple majority vote
-            action_counts = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
+            action_counts = [0, 0, 0]
             
             for signal in signals.values():
-                action = signal.get('action', 'HOLD')
-                action_counts[action] += 1
+                action_counts[_ACTION_ID.get(signal.get('action', 'HOLD'), 2)] += 1
             
             # Get the action with the most votes
-            best_action = max(action_counts, key=action_counts.get)
+            best_index = max(range(3), key=action_counts.__getitem__)
             
-            return {
-                'action': best_action,
-                'confidence': action_counts[best_action] / len(signals),
-                'all_signals': signals
-            } 
\ No newline at end of file
+            result = {
+                'action': _ACTION_NAME[best_index],
+                'confidence': action_counts[best_index] / len(signals)
+            }
+        
+        if return_details:
+            result['all_signals'] = signals
+        return result 
\ No newline at end of file
@@ -1,11 +1,30 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import numpy as np
+
+try:
+    from ._fib_kernels import fib_levels
+except ImportError:  # loaded as a top-level module, e.g. by adapter_factory
+    from _fib_kernels import fib_levels
+
+# Column order of the packed market_data['ohlcv'] array
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+OHLCV_DTYPE = np.float32
+
+# Price levels are stored as float32; the precision is far finer than tick size
+LEVEL_DTYPE = np.float32
 
 class BaseFibonacciAdapter(ABC):
     """
     Base class for all Fibonacci adapters.
     All specific adapters should inherit from this class and implement the abstract methods.
+    
+    Adapter modules loaded by FibonacciAdapterFactory should expose their adapter
+    class as a module-level ``ADAPTER_CLASS`` so the factory can resolve it directly.
+    
+    Market data is preferably passed as ``{'ohlcv': ndarray}`` with shape (T, 5)
+    and columns in OHLCV_COLUMNS order; separate per-column lists are still accepted.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -18,6 +37,20 @@ class BaseFibonacciAdapter(ABC):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Fibonacci ratios as float64 arrays for the level kernel
+        self._fib_ratios = np.asarray(
+            config.get('fibonacci_levels', [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1]), dtype=np.float64
+        )
+        self._ext_ratios = np.asarray(
+            config.get('extension_levels', [1.618, 2.618, 3.618]), dtype=np.float64
+        )
+        self._use_extension_levels = bool(config.get('use_extension_levels', False))
+        
+        # Market data that last passed validation and its key count; callers treat
+        # market data as immutable once built, so a repeated check can be skipped
+        self._last_validated = None
+        self._last_validated_size = 0
+        
     @abstractmethod
     def get_levels(self, market_data: Dict[str, Any]) -> Dict[str, List[float]]:
         """
@@ -57,8 +90,36 @@ class BaseFibonacciAdapter(ABC):
         Returns:
             Boolean indicating if the market data is valid
         """
-        required_fields = ['open', 'high', 'low', 'close', 'volume']
-        return all(field in market_data for field in required_fields)
+        if market_data is self._last_validated and len(market_data) == self._last_validated_size:
+            return True
+            
+        ohlcv = market_data.get('ohlcv')
+        if ohlcv is not None:
+            valid = isinstance(ohlcv, np.ndarray) and ohlcv.ndim == 2 and ohlcv.shape[1] == len(OHLCV_COLUMNS)
+        else:
+            valid = all(field in market_data for field in OHLCV_COLUMNS)
+            
+        if valid:
+            self._last_validated = market_data
+            self._last_validated_size = len(market_data)
+        return valid
+    
+    @staticmethod
+    def _unpack(market_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the open, high, low, close and volume series as arrays.
+        
+        Args:
+            market_data: Validated market data
+            
+        Returns:
+            Tuple of (open, high, low, close, volume) arrays; column views when
+            market_data carries a packed 'ohlcv' array, float64 copies of per-column lists otherwise
+        """
+        ohlcv = market_data.get('ohlcv')
+        if ohlcv is not None:
+            return ohlcv[:, 0], ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4]
+        return tuple(np.asarray(market_data[field], dtype=np.float64) for field in OHLCV_COLUMNS)
     
     def _find_swing_points(self, prices: List[float], min_points: int = 5) -> Tuple[List[int], List[int]]:
         """
@@ -75,23 +136,26 @@ class BaseFibonacciAdapter(ABC):
             self.logger.warning(f"Not enough price points for swing detection. Need at least {min_points}.")
             return [], []
             
-        swing_highs = []
-        swing_lows = []
+        p = np.asarray(prices, dtype=np.float64)
+        if len(p) < 5:
+            return [], []
+            
+        # Compare each point with its two neighbours on either side
+        center = p[2:-2]
+        neighbours = (p[:-4], p[1:-3], p[3:-1], p[4:])
+        
+        is_high = np.ones(len(center), dtype=bool)
+        is_low = np.ones(len(center), dtype=bool)
+        for neighbour in neighbours:
+            is_high &= center > neighbour
+            is_low &= center < neighbour
+            
+        swing_highs = (np.flatnonzero(is_high) + 2).tolist()
+        swing_lows = (np.flatnonzero(is_low) + 2).tolist()
         
-        for i in range(2, len(prices) - 2):
-            # Check for swing high
-            if prices[i] > prices[i-1] and prices[i] > prices[i-2] and \
-               prices[i] > prices[i+1] and prices[i] > prices[i+2]:
-                swing_highs.append(i)
-                
-            # Check for swing low
-            if prices[i] < prices[i-1] and prices[i] < prices[i-2] and \
-               prices[i] < prices[i+1] and prices[i] < prices[i+2]:
-                swing_lows.append(i)
-                
         return swing_highs, swing_lows
     
-    def _calculate_fibonacci_levels(self, start_price: float, end_price: float) -> Dict[str, List[float]]:
+    def _calculate_fibonacci_levels(self, start_price: float, end_price: float) -> Dict[str, np.ndarray]:
         """
         Calculate Fibonacci retracement and extension levels.
         
@@ -100,31 +164,14 @@ class BaseFibonacciAdapter(ABC):
             end_price: Ending price for the Fibonacci calculation
             
         Returns:
-            Dictionary with 'support' and 'resistance' keys, each containing a list of price levels
+            Dictionary with 'support' and 'resistance' keys, each containing a float32 array of price levels
         """
-        price_range = end_price - start_price
-        
-        # Get Fibonacci ratios from config or use defaults
-        fib_ratios = self.config.get('fibonacci_levels', [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1])
-        
-        # Calculate retracement levels
-        retracement_levels = [start_price + (price_range * ratio) for ratio in fib_ratios]
-        
-        # Calculate extension levels if enabled
-        extension_levels = []
-        if self.config.get('use_extension_levels', False):
-            ext_ratios = self.config.get('extension_levels', [1.618, 2.618, 3.618])
-            extension_levels = [start_price + (price_range * ratio) for ratio in ext_ratios]
-        
-        # Determine support and resistance based on price direction
-        if end_price > start_price:
-            support = retracement_levels
-            resistance = extension_levels
-        else:
-            support = extension_levels
-            resistance = retracement_levels
+        support, resistance = fib_levels(
+            float(start_price), float(end_price),
+            self._fib_ratios, self._ext_ratios, self._use_extension_levels
+        )
             
         return {
-            'support': support,
-            'resistance': resistance
+            'support': np.asarray(support, dtype=LEVEL_DTYPE),
+            'resistance': np.asarray(resistance, dtype=LEVEL_DTYPE)
         } 
\ No newline at end of file
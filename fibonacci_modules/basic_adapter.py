@@ -1,6 +1,10 @@
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 import numpy as np
-from .base_adapter import BaseFibonacciAdapter
+from .base_adapter import BaseFibonacciAdapter, LEVEL_DTYPE
+from ._fib_kernels import nearest_brackets, warm_up_in_background
+
+_NO_LEVELS = np.empty(0, dtype=LEVEL_DTYPE)
+_NO_LEVELS.flags.writeable = False
 
 class BasicFibonacciAdapter(BaseFibonacciAdapter):
     """
@@ -19,7 +23,10 @@ class BasicFibonacciAdapter(BaseFibonacciAdapter):
         self.min_swing_points = config.get('min_swing_points', 5)
         self.trend_confirmation_period = config.get('trend_confirmation_period', 14)
         
-    def get_levels(self, market_data: Dict[str, Any]) -> Dict[str, List[float]]:
+        # Compile the numeric kernels ahead of the first tick
+        warm_up_in_background()
+        
+    def get_levels(self, market_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
         """
         Calculate Fibonacci levels based on market data.
         
@@ -27,23 +34,33 @@ class BasicFibonacciAdapter(BaseFibonacciAdapter):
             market_data: Dictionary containing market data (OHLCV, etc.)
             
         Returns:
-            Dictionary with 'support' and 'resistance' keys, each containing a list of price levels
+            Dictionary with 'support' and 'resistance' keys, each containing a float32 array of price levels
         """
         if not self._validate_market_data(market_data):
             self.logger.error("Invalid market data provided")
-            return {'support': [], 'resistance': []}
+            return {'support': _NO_LEVELS, 'resistance': _NO_LEVELS}
             
+        return self._compute_levels(market_data)
+        
+    def _compute_levels(self, market_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Calculate Fibonacci levels from validated market data.
+        
+        Args:
+            market_data: Dictionary containing market data (OHLCV, etc.)
+            
+        Returns:
+            Dictionary with 'support' and 'resistance' keys, each containing a float32 array of price levels
+        """
         # Extract price data
-        closes = market_data['close']
-        highs = market_data['high']
-        lows = market_data['low']
+        _, highs, lows, closes, _ = self._unpack(market_data)
         
         # Find swing points
         swing_highs, swing_lows = self._find_swing_points(closes, self.min_swing_points)
         
         if not swing_highs or not swing_lows:
             self.logger.warning("Not enough swing points found for Fibonacci calculation")
-            return {'support': [], 'resistance': []}
+            return {'support': _NO_LEVELS, 'resistance': _NO_LEVELS}
             
         # Determine trend direction using simple moving average
         sma = np.mean(closes[-self.trend_confirmation_period:])
@@ -52,21 +69,23 @@ class BasicFibonacciAdapter(BaseFibonacciAdapter):
         
         # Calculate Fibonacci levels based on most recent swing points
         if trend_direction == 'up':
-            start_price = lows[swing_lows[-1]]
-            end_price = highs[swing_highs[-1]]
+            start_price = float(lows[swing_lows[-1]])
+            end_price = float(highs[swing_highs[-1]])
         else:
-            start_price = highs[swing_highs[-1]]
-            end_price = lows[swing_lows[-1]]
+            start_price = float(highs[swing_highs[-1]])
+            end_price = float(lows[swing_lows[-1]])
             
         return self._calculate_fibonacci_levels(start_price, end_price)
         
-    def get_signal(self, market_data: Dict[str, Any], current_price: float) -> Tuple[str, float]:
+    def get_signal(self, market_data: Dict[str, Any], current_price: float,
+                   levels: Optional[Dict[str, np.ndarray]] = None) -> Tuple[str, float]:
         """
         Generate a trading signal based on market data and current price.
         
         Args:
             market_data: Dictionary containing market data (OHLCV, etc.)
             current_price: Current market price
+            levels: Levels already returned by get_levels for this market data (optional)
             
         Returns:
             Tuple containing (signal_type, confidence)
@@ -77,18 +96,20 @@ class BasicFibonacciAdapter(BaseFibonacciAdapter):
             self.logger.error("Invalid market data provided")
             return 'hold', 0.0
             
-        # Get Fibonacci levels
-        levels = self.get_levels(market_data)
-        if not levels['support'] or not levels['resistance']:
+        # Get Fibonacci levels unless the caller already has them
+        if levels is None:
+            levels = self.get_levels(market_data)
+        if not levels['support'].size or not levels['resistance'].size:
             return 'hold', 0.0
             
-        # Calculate confidence based on proximity to Fibonacci levels
-        support_levels = sorted(levels['support'])
-        resistance_levels = sorted(levels['resistance'])
-        
         # Find nearest support and resistance levels
-        nearest_support = max([level for level in support_levels if level < current_price], default=min(support_levels))
-        nearest_resistance = min([level for level in resistance_levels if level > current_price], default=max(resistance_levels))
+        nearest_support, nearest_resistance = nearest_brackets(
+            np.sort(levels['support']),
+            np.sort(levels['resistance']),
+            float(current_price)
+        )
+        nearest_support = float(nearest_support)
+        nearest_resistance = float(nearest_resistance)
         
         # Calculate price ranges
         support_range = current_price - nearest_support
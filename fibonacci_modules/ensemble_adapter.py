@@ -1,13 +1,30 @@
-from typing import Dict, List, Any, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from .base_adapter import BaseFibonacciAdapter
+from ._fib_kernels import ensemble_levels, ensemble_levels_batch, warm_up_in_background
 
 class EnsembleFibonacciAdapter(BaseFibonacciAdapter):
     """
     Ensemble Fibonacci adapter that combines multiple Fibonacci strategies
     from various sources to improve accuracy and robustness.
+    
+    Every strategy places support at ``base + ratio * range`` and resistance at
+    ``top - ratio * range`` over some pair of price aggregates, so the whole
+    ensemble is evaluated as one vectorized expression.
     """
     
+    # Source repositories of the strategies, in evaluation order
+    STRATEGIES = ('harshgupta', 'brandon', 'ranjit', 'joengelh', 'faraway', 'nerr', 'doombringer')
+    
+    # Retracement ratio applied by each strategy (nerr uses fixed SMA bands instead)
+    _RATIOS = np.array([0.236, 0.382, 0.5, 0.618, 0.382, 0.0, 0.786])
+    _RATIOS.flags.writeable = False
+    
+    # Signal types indexed by the codes produced in get_signals_batch
+    _SIGNAL_TYPES = np.array(['buy', 'sell', 'hold'])
+    _SIGNAL_TYPES.flags.writeable = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the ensemble Fibonacci adapter.
@@ -16,15 +33,16 @@ class EnsembleFibonacciAdapter(BaseFibonacciAdapter):
             config: Dictionary containing adapter configuration
         """
         super().__init__(config)
-        self.strategies = [
-            self._strategy_harshgupta,
-            self._strategy_brandon,
-            self._strategy_ranjit,
-            self._strategy_joengelh,
-            self._strategy_faraway,
-            self._strategy_nerr,
-            self._strategy_doombringer
-        ]
+        self.strategies = self.STRATEGIES
+        
+        # Compile the numeric kernels ahead of the first tick
+        warm_up_in_background()
+        
+        # Recent get_levels results keyed by a fingerprint of the price window. Off by
+        # default: hashing the full window often costs more than recomputing the levels
+        self.cache_levels = config.get('cache_levels', False)
+        self.levels_cache_size = config.get('levels_cache_size', 128)
+        self._levels_cache = OrderedDict()
         
     def get_levels(self, market_data: Dict[str, Any]) -> Dict[str, List[float]]:
         """
@@ -40,33 +58,86 @@ class EnsembleFibonacciAdapter(BaseFibonacciAdapter):
             self.logger.error("Invalid market data provided")
             return {'support': [], 'resistance': []}
             
-        # Extract price data
-        closes = market_data['close']
-        highs = market_data['high']
-        lows = market_data['low']
-        
-        # Collect support and resistance levels from all strategies
-        support_levels = []
-        resistance_levels = []
-        
-        for strategy in self.strategies:
-            result = strategy(market_data)
-            support_levels.append(result['support'])
-            resistance_levels.append(result['resistance'])
+        key = self._window_fingerprint(market_data) if self.cache_levels else None
+        if key is not None:
+            levels = self._levels_cache.get(key)
+            if levels is not None:
+                self._levels_cache.move_to_end(key)
+                return levels
+            
+        levels = self._compute_levels(market_data)
+        
+        if key is not None:
+            self._levels_cache[key] = levels
+            if len(self._levels_cache) > self.levels_cache_size:
+                self._levels_cache.popitem(last=False)
+        return levels
+        
+    def _compute_levels(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calculate the ensemble levels from validated market data.
+        
+        Args:
+            market_data: Dictionary containing market data (OHLCV, etc.)
             
-        # Calculate ensemble averages
-        ensemble_support = np.mean(support_levels)
-        ensemble_resistance = np.mean(resistance_levels)
+        Returns:
+            Dictionary with the ensemble and per-strategy support and resistance levels
+        """
+        # Evaluate all strategies and their averages in one compiled call
+        ensemble_support, ensemble_resistance, support_levels, resistance_levels = ensemble_levels(
+            *self._price_series(market_data), self._RATIOS
+        )
         
         # Return both the ensemble averages and individual levels
         return {
             'support': [ensemble_support],
             'resistance': [ensemble_resistance],
-            'support_levels': support_levels,
-            'resistance_levels': resistance_levels,
+            'support_levels': support_levels.tolist(),
+            'resistance_levels': resistance_levels.tolist(),
             'strategies_used': len(self.strategies)
         }
         
+    @staticmethod
+    def _window_fingerprint(market_data: Dict[str, Any]) -> Optional[Tuple[int, ...]]:
+        """
+        Build a fingerprint of the whole price window. The levels depend on the extremes
+        of the full series, so every bar is hashed, not just the latest ones.
+        
+        Args:
+            market_data: Validated market data
+            
+        Returns:
+            Tuple identifying the window, or None for an empty series
+        """
+        ohlcv = market_data.get('ohlcv')
+        if ohlcv is not None:
+            highs, lows, closes = ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3]
+        else:
+            highs, lows, closes = market_data['high'], market_data['low'], market_data['close']
+        if not len(closes):
+            return None
+        return (len(closes),) + tuple(
+            hash(np.ascontiguousarray(series, dtype=np.float64).tobytes())
+            for series in (highs, lows, closes)
+        )
+        
+    def _price_series(self, market_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the high, low and close series as contiguous float64 arrays.
+        
+        Args:
+            market_data: Validated market data
+            
+        Returns:
+            Tuple of (high, low, close) arrays
+        """
+        _, highs, lows, closes, _ = self._unpack(market_data)
+        return (
+            np.ascontiguousarray(highs, dtype=np.float64),
+            np.ascontiguousarray(lows, dtype=np.float64),
+            np.ascontiguousarray(closes, dtype=np.float64)
+        )
+        
     def get_signal(self, market_data: Dict[str, Any], current_price: float) -> Tuple[str, float]:
         """
         Generate a trading signal based on market data and current price.
@@ -110,70 +181,43 @@ class EnsembleFibonacciAdapter(BaseFibonacciAdapter):
             confidence = 1 - (resistance_distance / total_range)
             return 'sell', confidence
             
-    # === Individual Strategy Implementations ===
-    
-    def _strategy_harshgupta(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from harshgupta repository."""
-        high = max(data["high"])
-        low = min(data["low"])
-        diff = high - low
-        return {
-            "support": low + diff * 0.236,
-            "resistance": high - diff * 0.236
-        }
-        
-    def _strategy_brandon(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from brandon repository."""
-        high = max(data["high"])
-        low = min(data["low"])
-        return {
-            "support": low + (high - low) * 0.382,
-            "resistance": high - (high - low) * 0.382
-        }
-        
-    def _strategy_ranjit(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from ranjit repository."""
-        close = np.array(data["close"])
-        peak = np.max(close)
-        trough = np.min(close)
-        diff = peak - trough
-        return {
-            "support": trough + 0.5 * diff,
-            "resistance": peak - 0.5 * diff
-        }
-        
-    def _strategy_joengelh(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from joengelh repository."""
-        high = max(data["high"])
-        low = min(data["low"])
-        return {
-            "support": low + (high - low) * 0.618,
-            "resistance": high - (high - low) * 0.618
-        }
+    def get_signals_batch(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                          current_prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate trading signals for a batch of price windows at once, e.g. for backtests.
+        Equivalent to calling get_signal on each window.
         
-    def _strategy_faraway(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from faraway repository."""
-        high = np.mean(data["high"][-20:])
-        low = np.mean(data["low"][-20:])
-        return {
-            "support": low + 0.382 * (high - low),
-            "resistance": high - 0.382 * (high - low)
-        }
+        Args:
+            highs: 2-D array of high prices, one window per row
+            lows: 2-D array of low prices, same shape as highs
+            closes: 2-D array of close prices, same shape as highs
+            current_prices: Current market price for each window
+            
+        Returns:
+            Tuple of (signal_types, confidences) arrays, one entry per window
+            signal_types: 'buy', 'sell', or 'hold'
+            confidences: Floats indicating signal confidence
+        """
+        ensemble_support, ensemble_resistance = ensemble_levels_batch(
+            np.ascontiguousarray(highs, dtype=np.float64),
+            np.ascontiguousarray(lows, dtype=np.float64),
+            np.ascontiguousarray(closes, dtype=np.float64),
+            self._RATIOS
+        )
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+        
+        # Calculate distances to the ensemble levels
+        support_distance = current_prices - ensemble_support
+        resistance_distance = ensemble_resistance - current_prices
+        total_range = resistance_distance + support_distance
+        has_range = total_range != 0
         
-    def _strategy_nerr(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from nerr repository."""
-        close = np.array(data["close"])
-        sma = np.mean(close[-10:])
-        return {
-            "support": sma * 0.95,
-            "resistance": sma * 1.05
-        }
+        # Buy when closer to support, sell otherwise; hold when the range is empty
+        is_buy = support_distance < resistance_distance
+        codes = np.where(has_range, np.where(is_buy, 0, 1), 2)
+        nearest_distance = np.where(is_buy, support_distance, resistance_distance)
+        confidences = np.zeros_like(total_range)
+        np.divide(nearest_distance, total_range, out=confidences, where=has_range)
+        np.subtract(1.0, confidences, out=confidences, where=has_range)
         
-    def _strategy_doombringer(self, data: Dict[str, List[float]]) -> Dict[str, float]:
-        """Strategy from doombringer repository."""
-        low = min(data["low"])
-        high = max(data["high"])
-        return {
-            "support": low + (high - low) * 0.786,
-            "resistance": high - (high - low) * 0.786
-        } 
\ No newline at end of file
+        return self._SIGNAL_TYPES[codes], confidences
\ No newline at end of file
@@ -1,7 +1,6 @@
 import numpy as np
-import json
 import os
-from adapter_factory import FibonacciAdapterFactory
+from adapter_factory import FibonacciAdapterFactory, _read_config
 from ensemble_adapter import EnsembleFibonacciAdapter
 
 # Import the fibonacci_agent.py functions
@@ -18,6 +17,11 @@ from fibonacci_agent import (
     generate_signal
 )
 
+def _load_config():
+    """Load config.json from this directory, re-reading it only after it changes."""
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+    return _read_config(config_path)
+
 def compare_approaches():
     """Compare the fibonacci_agent.py approach with our adapter system."""
     print("Comparing fibonacci_agent.py with adapter system...")
@@ -56,9 +60,7 @@ def compare_approaches():
     print("\n=== Approach 3: Use ensemble adapter directly ===")
     
     # Load configuration
-    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = _load_config()
     
     # Create ensemble adapter
     ensemble_config = config.get('ensemble', {})
@@ -111,9 +113,7 @@ def demonstrate_integration():
                 return 'hold', 0.0
     
     # Create custom adapter
-    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = _load_config()
     
     custom_config = config.get('ensemble', {})
     custom_adapter = CustomFibonacciAdapter(custom_config)
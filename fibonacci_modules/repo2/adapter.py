@@ -1,13 +1,9 @@
-import sys
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import numpy as np
 
-# Add the parent directory to the path so we can import the base adapter
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from base_adapter import FibonacciBaseAdapter
+from ..base_adapter import BaseFibonacciAdapter
 
-class FibonacciRepo2Adapter(FibonacciBaseAdapter):
+class FibonacciRepo2Adapter(BaseFibonacciAdapter):
     """
     Adapter for the second Fibonacci repository.
     This adapter implements an extended Fibonacci retracement calculation
@@ -16,11 +12,21 @@ class FibonacciRepo2Adapter(FibonacciBaseAdapter):
     
     # Standard Fibonacci ratios
     FIB_RATIOS = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1]
+    _RATIOS = np.array(FIB_RATIOS, dtype=np.float64)
+    _RATIOS.flags.writeable = False
+    
+    # Ratios whose level is pinned to the low / the high
+    _IS_LOW = _RATIOS == 0
+    _IS_HIGH = _RATIOS == 1
+    _IS_LOW.flags.writeable = False
+    _IS_HIGH.flags.writeable = False
     
     # Extension ratios
     EXTENSION_RATIOS = [1.618, 2.618, 3.618, 4.236]
+    _EXTENSION_OFFSETS = np.array(EXTENSION_RATIOS, dtype=np.float64) - 1
+    _EXTENSION_OFFSETS.flags.writeable = False
     
-    def get_levels(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_levels(self, price_data: Dict[str, Any], include_level_lists: bool = True) -> Dict[str, Any]:
         """
         Calculate Fibonacci retracement and extension levels based on price data.
         
@@ -30,9 +36,12 @@ class FibonacciRepo2Adapter(FibonacciBaseAdapter):
                 - 'high': Highest price in the period
                 - 'low': Lowest price in the period
                 - 'close': Current closing price
+            include_level_lists: If False, skip building the sorted 'support_levels'
+                and 'resistance_levels' lists and the ratio-keyed level dicts
                 
         Returns:
-            Dictionary containing Fibonacci levels
+            Dictionary containing Fibonacci levels; level values are also returned as
+            arrays aligned with the class ratio arrays
         """
         # Extract price data
         high = price_data.get('high', 0)
@@ -42,65 +51,49 @@ class FibonacciRepo2Adapter(FibonacciBaseAdapter):
         # Calculate price range
         price_range = high - low
         
-        # Calculate Fibonacci retracement levels
-        retracement_levels = {}
-        for ratio in self.FIB_RATIOS:
-            if ratio == 0:
-                retracement_levels[ratio] = low
-            elif ratio == 1:
-                retracement_levels[ratio] = high
-            else:
-                retracement_levels[ratio] = high - (price_range * ratio)
+        # Calculate Fibonacci retracement levels (ratio 0 maps to the low and ratio 1 to the high)
+        level_values = high - price_range * self._RATIOS
+        level_values[self._IS_LOW] = low
+        level_values[self._IS_HIGH] = high
         
         # Calculate Fibonacci extension levels
-        extension_levels = {}
-        for ratio in self.EXTENSION_RATIOS:
-            extension_levels[ratio] = high + (price_range * (ratio - 1))
-        
-        # Determine support and resistance
-        support_levels = []
-        resistance_levels = []
-        
-        # Add retracement levels
-        for ratio, level in retracement_levels.items():
-            if level < close:
-                support_levels.append(level)
-            else:
-                resistance_levels.append(level)
-        
-        # Add extension levels (always above current price)
-        for ratio, level in extension_levels.items():
-            resistance_levels.append(level)
-        
-        # Sort levels
-        support_levels.sort(reverse=True)
-        resistance_levels.sort()
+        extension_values = high + price_range * self._EXTENSION_OFFSETS
         
         # Get nearest support and resistance
-        nearest_support = support_levels[0] if support_levels else None
-        nearest_resistance = resistance_levels[0] if resistance_levels else None
+        # (extension levels always count as resistance)
+        is_support = level_values < close
+        support_values = level_values[is_support]
+        resistance_values = np.concatenate((level_values[~is_support], extension_values))
         
-        return {
-            'support': nearest_support,
-            'resistance': nearest_resistance,
-            'support_levels': support_levels,
-            'resistance_levels': resistance_levels,
-            'retracement_levels': retracement_levels,
-            'extension_levels': extension_levels
+        levels = {
+            'support': float(support_values.max()) if support_values.size else None,
+            'resistance': float(resistance_values.min()) if resistance_values.size else None,
+            'retracement_values': level_values,
+            'extension_values': extension_values
         }
+        
+        if include_level_lists:
+            levels['retracement_levels'] = dict(zip(self.FIB_RATIOS, level_values.tolist()))
+            levels['extension_levels'] = dict(zip(self.EXTENSION_RATIOS, extension_values.tolist()))
+            levels['support_levels'] = np.sort(support_values)[::-1].tolist()
+            levels['resistance_levels'] = np.sort(resistance_values).tolist()
+        
+        return levels
     
-    def get_signal(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_signal(self, price_data: Dict[str, Any], levels: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate a trading signal based on Fibonacci analysis.
         
         Args:
             price_data: Dictionary containing price information
+            levels: Levels already returned by get_levels for this price data (optional)
             
         Returns:
             Dictionary containing signal information
         """
-        # Get Fibonacci levels
-        levels = self.get_levels(price_data)
+        # Get Fibonacci levels unless the caller already has them
+        if levels is None:
+            levels = self.get_levels(price_data, include_level_lists=False)
         
         # Extract data
         close = price_data.get('close', 0)
@@ -133,4 +126,7 @@ class FibonacciRepo2Adapter(FibonacciBaseAdapter):
                 signal['action'] = 'SELL'
                 signal['confidence'] = 0.6
         
-        return signal 
\ No newline at end of file
+        return signal 
+
+# Adapter class resolved by FibonacciAdapterFactory
+ADAPTER_CLASS = FibonacciRepo2Adapter
\ No newline at end of file
@@ -1,16 +1,9 @@
-import sys
-import os
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
 
-# Add the parent directory to the path so we can import the base adapter
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from base_adapter import FibonacciBaseAdapter
+from ..base_adapter import BaseFibonacciAdapter
 
-class FibonacciRepo3Adapter(FibonacciBaseAdapter):
+class FibonacciRepo3Adapter(BaseFibonacciAdapter):
     """
     Adapter for the third Fibonacci repository.
     This adapter implements a machine learning approach to Fibonacci analysis.
@@ -18,24 +11,70 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
     
     # Standard Fibonacci ratios
     FIB_RATIOS = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1]
+    _RATIOS = np.array(FIB_RATIOS, dtype=np.float64)
+    _RATIOS.flags.writeable = False
     
-    def __init__(self):
-        """Initialize the ML model and scaler."""
-        self.model = RandomForestClassifier(
-            n_estimators=100,
-            max_depth=10,
-            random_state=42
-        )
-        self.scaler = StandardScaler()
+    # Ratios whose level is pinned to the low / the high
+    _IS_LOW = _RATIOS == 0
+    _IS_HIGH = _RATIOS == 1
+    _IS_LOW.flags.writeable = False
+    _IS_HIGH.flags.writeable = False
+    
+    # Model class label to trading action
+    ACTION_MAP = {0: 'SELL', 1: 'HOLD', 2: 'BUY'}
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the adapter; the ML model and scaler are created on first training.
+        
+        Args:
+            config: Dictionary containing adapter configuration
+        """
+        super().__init__(config)
+        self.model = None
+        self.scaler = None
         self.is_trained = False
+        
+        # Trading action for each column of predict_proba, set at training time
+        self._class_actions = ()
     
-    def _extract_features(self, price_data: Dict[str, Any], fib_levels: Dict[float, float]) -> np.ndarray:
+    def _ensure_model(self) -> None:
+        """Create the ML model and scaler, importing scikit-learn on first use."""
+        if self.model is None:
+            from sklearn.ensemble import RandomForestClassifier
+            from sklearn.preprocessing import StandardScaler
+            
+            self.model = RandomForestClassifier(
+                n_estimators=100,
+                max_depth=10,
+                random_state=42,
+                n_jobs=-1,
+                max_features='sqrt'
+            )
+            self.scaler = StandardScaler()
+    
+    def train(self, features: np.ndarray, labels: np.ndarray) -> None:
+        """
+        Fit the scaler and ML model.
+        
+        Args:
+            features: 2-D array of features, one row per sample (see _extract_features);
+                converted to float32
+            labels: Array of class labels (0 = SELL, 1 = HOLD, 2 = BUY)
+        """
+        self._ensure_model()
+        features = np.asarray(features, dtype=np.float32)
+        self.model.fit(self.scaler.fit_transform(features), labels)
+        self._class_actions = tuple(self.ACTION_MAP.get(label, 'HOLD') for label in self.model.classes_)
+        self.is_trained = True
+    
+    def _extract_features(self, price_data: Dict[str, Any], fib_levels: np.ndarray) -> np.ndarray:
         """
         Extract features from price data and Fibonacci levels.
         
         Args:
             price_data: Dictionary containing price information
-            fib_levels: Dictionary of Fibonacci levels
+            fib_levels: Array of Fibonacci level values
             
         Returns:
             NumPy array of features
@@ -43,14 +82,8 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
         # Extract price data
         close = price_data.get('close', 0)
         
-        # Initialize features list
-        features = []
-        
-        # Add Fibonacci level features
-        for ratio, level in fib_levels.items():
-            # Distance to each Fibonacci level
-            distance = (close - level) / close
-            features.append(distance)
+        # Add Fibonacci level features: distance to each Fibonacci level
+        features = ((close - fib_levels) / close).tolist()
         
         # Add price momentum (if available)
         if 'returns' in price_data:
@@ -64,8 +97,8 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
         if 'volume_ratio' in price_data:
             features.append(price_data['volume_ratio'])
         
-        # Return as numpy array
-        return np.array(features).reshape(1, -1)
+        # Return as a float32 numpy array
+        return np.array(features, dtype=np.float32).reshape(1, -1)
     
     def _predict_price_movement(self, features: np.ndarray) -> Tuple[str, float]:
         """
@@ -84,22 +117,19 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
         # Scale features
         scaled_features = self.scaler.transform(features)
         
-        # Get prediction probabilities
+        # Get prediction probabilities; the predicted class is the most probable one
         probabilities = self.model.predict_proba(scaled_features)[0]
-        
-        # Get predicted class
-        predicted_class = self.model.predict(scaled_features)[0]
+        predicted_index = int(np.argmax(probabilities))
         
         # Map class to action
-        action_map = {0: 'SELL', 1: 'HOLD', 2: 'BUY'}
-        action = action_map.get(predicted_class, 'HOLD')
+        action = self._class_actions[predicted_index]
         
         # Calculate confidence
-        confidence = probabilities[predicted_class]
+        confidence = float(probabilities[predicted_index])
         
         return action, confidence
     
-    def get_levels(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_levels(self, price_data: Dict[str, Any], include_level_lists: bool = True) -> Dict[str, Any]:
         """
         Calculate Fibonacci retracement levels based on price data.
         
@@ -109,9 +139,12 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
                 - 'high': Highest price in the period
                 - 'low': Lowest price in the period
                 - 'close': Current closing price
+            include_level_lists: If False, skip building the sorted 'support_levels'
+                and 'resistance_levels' lists and the ratio-keyed level dicts
                 
         Returns:
-            Dictionary containing Fibonacci levels
+            Dictionary containing Fibonacci levels; level values are also returned as
+            arrays aligned with the class ratio arrays
         """
         # Extract price data
         high = price_data.get('high', 0)
@@ -121,57 +154,46 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
         # Calculate price range
         price_range = high - low
         
-        # Calculate Fibonacci levels
-        retracement_levels = {}
-        for ratio in self.FIB_RATIOS:
-            if ratio == 0:
-                retracement_levels[ratio] = low
-            elif ratio == 1:
-                retracement_levels[ratio] = high
-            else:
-                retracement_levels[ratio] = high - (price_range * ratio)
-        
-        # Determine support and resistance
-        support_levels = []
-        resistance_levels = []
-        
-        for ratio, level in retracement_levels.items():
-            if level < close:
-                support_levels.append(level)
-            else:
-                resistance_levels.append(level)
-        
-        # Sort levels
-        support_levels.sort(reverse=True)
-        resistance_levels.sort()
+        # Calculate Fibonacci levels (ratio 0 maps to the low and ratio 1 to the high)
+        level_values = high - price_range * self._RATIOS
+        level_values[self._IS_LOW] = low
+        level_values[self._IS_HIGH] = high
         
         # Get nearest support and resistance
-        nearest_support = support_levels[0] if support_levels else None
-        nearest_resistance = resistance_levels[0] if resistance_levels else None
-        
-        return {
-            'support': nearest_support,
-            'resistance': nearest_resistance,
-            'support_levels': support_levels,
-            'resistance_levels': resistance_levels,
-            'retracement_levels': retracement_levels
+        is_support = level_values < close
+        support_values = level_values[is_support]
+        resistance_values = level_values[~is_support]
+        
+        levels = {
+            'support': float(support_values.max()) if support_values.size else None,
+            'resistance': float(resistance_values.min()) if resistance_values.size else None,
+            'retracement_values': level_values
         }
+        
+        if include_level_lists:
+            levels['retracement_levels'] = dict(zip(self.FIB_RATIOS, level_values.tolist()))
+            levels['support_levels'] = np.sort(support_values)[::-1].tolist()
+            levels['resistance_levels'] = np.sort(resistance_values).tolist()
+        
+        return levels
     
-    def get_signal(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_signal(self, price_data: Dict[str, Any], levels: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate a trading signal based on Fibonacci analysis and ML prediction.
         
         Args:
             price_data: Dictionary containing price information
+            levels: Levels already returned by get_levels for this price data (optional)
             
         Returns:
             Dictionary containing signal information
         """
-        # Get Fibonacci levels
-        levels = self.get_levels(price_data)
+        # Get Fibonacci levels unless the caller already has them
+        if levels is None:
+            levels = self.get_levels(price_data, include_level_lists=False)
         
         # Extract features for ML prediction
-        features = self._extract_features(price_data, levels['retracement_levels'])
+        features = self._extract_features(price_data, levels['retracement_values'])
         
         # Predict price movement
         ml_action, ml_confidence = self._predict_price_movement(features)
@@ -208,4 +230,7 @@ class FibonacciRepo3Adapter(FibonacciBaseAdapter):
                 'confidence': ml_confidence
             }
         
-        return signal 
\ No newline at end of file
+        return signal 
+
+# Adapter class resolved by FibonacciAdapterFactory
+ADAPTER_CLASS = FibonacciRepo3Adapter
\ No newline at end of file
@@ -1,9 +1,13 @@
 import numpy as np
-import json
 import os
-from adapter_factory import FibonacciAdapterFactory
+from adapter_factory import FibonacciAdapterFactory, _read_config
 from ensemble_adapter import EnsembleFibonacciAdapter
 
+def _load_config():
+    """Load config.json from this directory, re-reading it only after it changes."""
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+    return _read_config(config_path)
+
 def generate_test_data(num_points=100):
     """Generate test market data."""
     np.random.seed(42)  # For reproducibility
@@ -17,11 +21,12 @@ def generate_test_data(num_points=100):
     high = close + np.random.uniform(0.5, 1.5, num_points)
     low = close - np.random.uniform(0.5, 1.5, num_points)
     
+    # Hand the series over as contiguous float32 arrays rather than Python lists
     return {
-        "close": close.tolist(),
-        "high": high.tolist(),
-        "low": low.tolist(),
-        "volume": np.random.uniform(1000, 5000, num_points).tolist()
+        "close": np.ascontiguousarray(close, dtype=np.float32),
+        "high": np.ascontiguousarray(high, dtype=np.float32),
+        "low": np.ascontiguousarray(low, dtype=np.float32),
+        "volume": np.random.uniform(1000, 5000, num_points).astype(np.float32)
     }
 
 def test_ensemble_adapter():
@@ -29,9 +34,7 @@ def test_ensemble_adapter():
     print("Testing Ensemble Adapter directly...")
     
     # Load configuration
-    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = _load_config()
     
     # Create ensemble adapter
     ensemble_config = config.get('ensemble', {})
@@ -5,17 +5,20 @@ import threading
 from orchestrator import Orchestrator
 from ai_agents.parent_agent import ParentAgent
 from ai_agents.child_agent import ChildAgent
-from ai_agents.strategies import STRATEGIES
+from ai_agents.strategies import STRATEGY_ITEMS
 from feeds.signal_processor import SignalProcessor
-from utils.logger import logger
+from utils.logger import logger, disable_record_metadata
 from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import logging
 from typing import Dict, Any
+from config import get_config
 
 # Load environment variables
 load_dotenv()
+get_config()
 
 # Configure logging
 logging.basicConfig(
@@ -39,7 +42,8 @@ from api.ai_chat import router as ai_chat_router
 app = FastAPI(
     title="NOS Trade API",
     description="API for the NOS Trade multi-agent trading system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -82,7 +86,7 @@ async def setup_ai_agents():
     
     # Add strategies to each agent
     for agent in [btc_agent, eth_agent, forex_agent]:
-        for strategy_name, strategy_fn in STRATEGIES.items():
+        for strategy_name, strategy_fn in STRATEGY_ITEMS:
             agent.add_strategy(strategy_name, strategy_fn)
     
     # Create parent agent
@@ -92,16 +96,16 @@ async def setup_ai_agents():
 
 def start_price_feed_server():
     """
-    Start the price feed server in a separate process
+    Start the price feed server in a separate process.
+    SignalProcessor's PriceFeedClient polls and posts to it on localhost:3000.
     """
     import subprocess
-    import sys
     
-    # Start the Node.js server
+    # Start the Node.js server; its output is discarded since nothing reads the pipes
     node_process = subprocess.Popen(
         ["node", "feeds/price_feed_server.js"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
     
     logger.info("Started price feed server")
@@ -154,5 +158,16 @@ async def main():
         raise
 
 if __name__ == "__main__":
+    # Prefer the libuv-based event loop where available; it is not
+    # supported on Windows, so fall back to the default asyncio loop.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
+
+    # None of this process's log formats print thread or process fields
+    disable_record_metadata()
+
     # Run the main function
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,9 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 
-app = FastAPI(title="OCAPulse.io API")
+app = FastAPI(title="OCAPulse.io API", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
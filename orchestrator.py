@@ -1,4 +1,5 @@
 import asyncio
+from typing import Dict, Optional
 from agents.market_data import MarketDataAgent
 from agents.ai_agent import AIAgent
 from agents.trading_agent import TradingAgent
@@ -6,11 +7,27 @@ from utils.logger import logger
 from utils.data_models import PriceUpdate, AIResult, OrderReceipt
 
 class Orchestrator:
-    def __init__(self):
+    # Seconds between flushes of buffered price updates
+    BATCH_INTERVAL = 0.25
+
+    def __init__(self, signal_router=None):
+        """
+        Initialize the trading system components
+        
+        Args:
+            signal_router: Optional SignalRouter to run on price updates
+        """
         self.market_data = MarketDataAgent()
         self.ai_agent = AIAgent()
         self.trading_agent = TradingAgent()
         self.running = False
+        
+        # Latest unprocessed price update per symbol, drained by the batch task
+        self._pending: Dict[str, PriceUpdate] = {}
+        self._batch_task: Optional[asyncio.Task] = None
+        
+        self.signal_router = signal_router
+        self._router_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """
@@ -20,8 +37,14 @@ class Orchestrator:
             self.running = True
             await self.market_data.initialize()
             
-            # Subscribe to market data updates
+            # Subscribe to market data updates and process them in batches
             self.market_data.subscribe_to_prices(self._handle_price_update)
+            self._batch_task = asyncio.create_task(self._process_batches())
+            
+            # Push price updates to the signal router instead of having it poll
+            if self.signal_router is not None:
+                self.market_data.subscribe_to_prices(self.signal_router.on_price_update)
+                self._router_task = asyncio.create_task(self.signal_router.run())
             
             # Start market data streams
             await self.market_data.start()
@@ -31,18 +54,31 @@ class Orchestrator:
             await self.cleanup()
             raise
 
-    async def _handle_price_update(self, price_update: PriceUpdate):
+    def _handle_price_update(self, price_update: PriceUpdate):
+        """
+        Handle incoming price updates by buffering the latest one per symbol
+        """
+        self._pending[price_update.symbol] = price_update
+
+    async def _process_batches(self):
+        """
+        Periodically process the buffered price updates of all symbols concurrently
+        """
+        while self.running:
+            await asyncio.sleep(self.BATCH_INTERVAL)
+            if not self._pending:
+                continue
+            
+            batch, self._pending = self._pending, {}
+            await asyncio.gather(*(self._process_price_update(update) for update in batch.values()))
+
+    async def _process_price_update(self, price_update: PriceUpdate):
         """
-        Handle incoming price updates
+        Analyze a price update and act on the result
         """
         try:
             # Get AI analysis
-            ai_result = self.ai_agent.analyze({
-                'symbol': price_update.symbol,
-                'price': price_update.price,
-                'timestamp': price_update.timestamp,
-                'source': price_update.source
-            })
+            ai_result = await asyncio.to_thread(self.ai_agent.analyze, price_update)
             
             # Execute trading logic based on AI analysis
             await self._execute_trading_strategy(price_update, ai_result)
@@ -57,29 +93,19 @@ class Orchestrator:
         try:
             # Example trading logic - replace with your strategy
             if ai_result.confidence > 0.8:
-                if "BUY" in ai_result.analysis.upper():
-                    order = self.trading_agent.execute_trade(
+                analysis = ai_result.analysis.upper()
+                if "BUY" in analysis:
+                    # Buy with stop loss and take profit
+                    order, _, _ = await self.trading_agent.execute_trade_with_brackets(
                         symbol=price_update.symbol,
                         side="BUY",
                         qty=1.0,
-                        exchange=price_update.source
-                    )
-                    # Set stop loss and take profit
-                    self.trading_agent.set_stop_loss(
-                        symbol=price_update.symbol,
-                        entry_price=price_update.price,
-                        side="BUY",
-                        exchange=price_update.source
-                    )
-                    self.trading_agent.set_take_profit(
-                        symbol=price_update.symbol,
                         entry_price=price_update.price,
-                        side="BUY",
                         exchange=price_update.source
                     )
                     logger.info(f"Executed buy order: {order}")
                 
-                elif "SELL" in ai_result.analysis.upper():
+                elif "SELL" in analysis:
                     order = self.trading_agent.execute_trade(
                         symbol=price_update.symbol,
                         side="SELL",
@@ -96,4 +122,10 @@ class Orchestrator:
         Cleanup resources
         """
         self.running = False
+        if self._batch_task:
+            self._batch_task.cancel()
+            self._batch_task = None
+        if self._router_task:
+            self._router_task.cancel()
+            self._router_task = None
         await self.market_data.cleanup() 
\ No newline at end of file
@@ -1,5 +1,6 @@
-import time
+import asyncio
 import logging
+from enum import IntEnum
 from typing import Dict, Any, Optional
 
 # Import our adapter factory for Fibonacci signals
@@ -12,18 +13,31 @@ from fibonacci_agent import ensemble_fibonacci_signal
 from ai_agent_parent import ParentAI
 from trading_bot_executor import TradeExecutor
 
+class Action(IntEnum):
+    """Trading action encoded as an integer."""
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+
+# Action for each signal string, in upper and lower case; built once at import
+_ACTION_CODES = {
+    **{action.name: action for action in Action},
+    **{action.name.lower(): action for action in Action}
+}
+
 class SignalRouter:
     """
     SignalRouter class that integrates Fibonacci ensemble signals with the parent AI agent
     and trade executor for real-time signal processing and execution.
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, min_price_change: float = 0.0):
         """
         Initialize the SignalRouter with the parent AI agent and trade executor.
         
         Args:
             config_path: Optional path to the configuration file for the Fibonacci adapter factory
+            min_price_change: Minimum relative price move that triggers a new signal cycle
         """
         # Set up logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -36,25 +50,31 @@ class SignalRouter:
         
         # Initialize Fibonacci adapter factory
         self.fibonacci_factory = FibonacciAdapterFactory(config_path)
+        
+        # Price-driven triggering: last price per symbol and the pending-cycle event
+        self.min_price_change = min_price_change
+        self._last_prices: Dict[str, float] = {}
+        self._price_event: Optional[asyncio.Event] = None
         self.logger.info("SignalRouter initialization complete")
         
-    def process_signal(self):
+    async def process_signal(self):
         """
         Process signals from the Fibonacci ensemble, analyze with parent AI,
         and execute trades if necessary.
+        The adapter system and the fibonacci_agent ensemble are queried concurrently.
         """
         try:
             # Get market data (placeholder - replace with actual market data source)
-            market_data = self._get_market_data()
+            market_data = await asyncio.to_thread(self._get_market_data)
             
             # Option 1: Use our adapter system
-            self.logger.info("[Router] Gathering market signal from Fibonacci Adapter System...")
-            adapter_signal = self.fibonacci_factory.get_signal(market_data)
-            self.logger.info(f"[Router] Received adapter signal: {adapter_signal['action']}, Confidence: {adapter_signal['confidence']:.2f}")
-            
             # Option 2: Use the fibonacci_agent directly
-            self.logger.info("[Router] Gathering market signal from Fibonacci Ensemble...")
-            ensemble_signal = ensemble_fibonacci_signal()
+            self.logger.info("[Router] Gathering market signals from Fibonacci Adapter System and Fibonacci Ensemble...")
+            adapter_signal, ensemble_signal = await asyncio.gather(
+                asyncio.to_thread(self.fibonacci_factory.get_signal, market_data),
+                asyncio.to_thread(self._get_ensemble_signal)
+            )
+            self.logger.info(f"[Router] Received adapter signal: {adapter_signal['action']}, Confidence: {adapter_signal['confidence']:.2f}")
             self.logger.info(f"[Router] Received ensemble signal: {ensemble_signal}")
             
             # Combine signals for more robust decision making
@@ -75,6 +95,37 @@ class SignalRouter:
         except Exception as e:
             self.logger.error(f"[Router] Error processing signal: {str(e)}")
             
+    def on_price_update(self, price_update) -> None:
+        """
+        Price feed callback; schedules a signal cycle when the price has moved enough.
+        Must be called from the event loop running run().
+        
+        Args:
+            price_update: PriceUpdate from the market data feed
+        """
+        last_price = self._last_prices.get(price_update.symbol)
+        if last_price and abs(price_update.price - last_price) < self.min_price_change * last_price:
+            return
+        
+        self._last_prices[price_update.symbol] = price_update.price
+        if self._price_event is not None:
+            self._price_event.set()
+            
+    async def run(self, debounce: float = 1.0):
+        """
+        Process signals whenever the price feed reports a meaningful move.
+        Bursts of updates within the debounce window coalesce into one cycle.
+        
+        Args:
+            debounce: Seconds to wait after a trigger before processing
+        """
+        self._price_event = asyncio.Event()
+        while True:
+            await self._price_event.wait()
+            await asyncio.sleep(debounce)
+            self._price_event.clear()
+            await self.process_signal()
+            
     def _get_market_data(self) -> Dict[str, Any]:
         """
         Get market data from the data source.
@@ -87,6 +138,15 @@ class SignalRouter:
         from fibonacci_agent import get_market_data
         return get_market_data()
         
+    def _get_ensemble_signal(self) -> str:
+        """
+        Get the signal from the fibonacci_agent ensemble.
+        
+        Returns:
+            Ensemble signal string ("BUY", "SELL" or "HOLD")
+        """
+        return ensemble_fibonacci_signal()
+        
     def _combine_signals(self, adapter_signal: Dict[str, Any], ensemble_signal: str) -> Dict[str, Any]:
         """
         Combine signals from the adapter system and the fibonacci_agent.
@@ -98,23 +158,26 @@ class SignalRouter:
         Returns:
             Combined signal dictionary
         """
-        # Map ensemble signal to our format
-        ensemble_action = ensemble_signal.lower()
+        adapter_action = adapter_signal['action']
+        adapter_confidence = adapter_signal['confidence']
+        
+        # If signals agree, increase confidence; actions are compared as codes
+        # since the adapter system reports upper-case and the ensemble either case.
+        # An unknown action never counts as agreement
+        confidence = adapter_confidence
+        adapter_code = _ACTION_CODES.get(adapter_action)
+        ensemble_code = _ACTION_CODES.get(ensemble_signal)
+        if adapter_code is not None and adapter_code == ensemble_code:
+            confidence = min(1.0, adapter_confidence + 0.2)
         
         # Create a combined signal
-        combined_signal = {
-            'action': adapter_signal['action'],
-            'confidence': adapter_signal['confidence'],
-            'ensemble_signal': ensemble_action,
-            'adapter_signal': adapter_signal['action'],
-            'adapter_confidence': adapter_signal['confidence']
+        return {
+            'action': adapter_action,
+            'confidence': confidence,
+            'ensemble_signal': ensemble_signal.lower(),
+            'adapter_signal': adapter_action,
+            'adapter_confidence': adapter_confidence
         }
-        
-        # If signals agree, increase confidence
-        if adapter_signal['action'] == ensemble_action:
-            combined_signal['confidence'] = min(1.0, adapter_signal['confidence'] + 0.2)
-            
-        return combined_signal
 
 if __name__ == "__main__":
     # Set up logging
@@ -123,10 +186,8 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # Initialize and run the signal router
-    router = SignalRouter()
+    from orchestrator import Orchestrator
     
-    # Run continuously
-    while True:
-        router.process_signal()
-        time.sleep(60)  # Check every minute 
\ No newline at end of file
+    # Initialize the signal router and drive it from the orchestrator's price feed
+    router = SignalRouter()
+    asyncio.run(Orchestrator(signal_router=router).start()) 
\ No newline at end of file
@@ -2,6 +2,124 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 
+from fibonacci_modules._fib_kernels import njit, warm_up_in_background
+
+# Standard Fibonacci ratios as a float64 array for the level kernel
+FIB_RATIOS = np.array([0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0], dtype=np.float64)
+FIB_RATIOS.flags.writeable = False
+
+@njit(cache=True)
+def _fib_levels_nb(high, low, ratios, out):
+    """
+    Fill out with the Fibonacci retracement levels between a high and low price.
+    Ratio 0 maps to the low and ratio 1 to the high.
+    
+    Args:
+        high: The swing high price
+        low: The swing low price
+        ratios: float64 array of Fibonacci ratios
+        out: float64 array of the same length as ratios, overwritten with the levels
+    """
+    price_range = high - low
+    for i in range(ratios.shape[0]):
+        ratio = ratios[i]
+        if ratio == 0:
+            out[i] = low
+        elif ratio == 1:
+            out[i] = high
+        else:
+            out[i] = high - price_range * ratio
+
+@njit(cache=True)
+def _swing_extremes_nb(high, low):
+    """
+    Find the highest high and lowest low in a single pass, skipping NaNs.
+    
+    Args:
+        high: float64 array of high prices
+        low: float64 array of low prices
+        
+    Returns:
+        Tuple of (swing_high, swing_low); NaN where a series has no values
+    """
+    swing_high = -np.inf
+    swing_low = np.inf
+    for i in range(high.shape[0]):
+        if high[i] > swing_high:
+            swing_high = high[i]
+    for i in range(low.shape[0]):
+        if low[i] < swing_low:
+            swing_low = low[i]
+    if swing_high == -np.inf:
+        swing_high = np.nan
+    if swing_low == np.inf:
+        swing_low = np.nan
+    return swing_high, swing_low
+
+@njit(cache=True)
+def _fib_pipeline(high, low, current_price, ratios, levels_out, support_out, resistance_out):
+    """
+    Compute the Fibonacci levels and split them around the current price in one pass.
+    Each level is insertion-sorted straight into its output slot, so no intermediate
+    containers are built.
+    
+    Args:
+        high: The swing high price
+        low: The swing low price
+        current_price: Current market price
+        ratios: float64 array of Fibonacci ratios
+        levels_out: float64 array of the same length as ratios, overwritten with the levels
+        support_out: float64 array of the same length, filled with the levels below the price, descending
+        resistance_out: float64 array of the same length, filled with the remaining levels, ascending
+        
+    Returns:
+        Tuple of (number of support levels, number of resistance levels,
+        nearest support, nearest resistance); NaN where there is no level
+    """
+    price_range = high - low
+    n_support = 0
+    n_resistance = 0
+    nearest_support = np.nan
+    nearest_resistance = np.nan
+    for i in range(ratios.shape[0]):
+        ratio = ratios[i]
+        if ratio == 0:
+            level = low
+        elif ratio == 1:
+            level = high
+        else:
+            level = high - price_range * ratio
+        levels_out[i] = level
+        
+        if level < current_price:
+            j = n_support
+            while j > 0 and support_out[j - 1] < level:
+                support_out[j] = support_out[j - 1]
+                j -= 1
+            support_out[j] = level
+            n_support += 1
+        else:
+            j = n_resistance
+            while j > 0 and resistance_out[j - 1] > level:
+                resistance_out[j] = resistance_out[j - 1]
+                j -= 1
+            resistance_out[j] = level
+            n_resistance += 1
+    
+    if n_support:
+        nearest_support = support_out[0]
+    if n_resistance:
+        nearest_resistance = resistance_out[0]
+    return n_support, n_resistance, nearest_support, nearest_resistance
+
+def _warm_up_kernels():
+    """Compile the kernels, or load them from numba's on-disk cache, ahead of the first tick."""
+    prices = np.array([2.0, 1.0])
+    _fib_levels_nb(2.0, 1.0, FIB_RATIOS, np.empty(len(FIB_RATIOS)))
+    _swing_extremes_nb(prices, prices)
+    buf = np.empty(len(FIB_RATIOS))
+    _fib_pipeline(2.0, 1.0, 1.5, FIB_RATIOS, buf, np.empty_like(buf), np.empty_like(buf))
+
 class FibonacciStrategy:
     """
     Fibonacci retracement strategy for technical analysis.
@@ -20,6 +138,23 @@ class FibonacciStrategy:
             lookback_period: Number of candles to look back for swing highs/lows
         """
         self.lookback_period = lookback_period
+        
+        # Reused output buffers for the level kernels
+        self._fib_levels_buf = np.empty(len(self.FIB_RATIOS), dtype=np.float64)
+        self._support_buf = np.empty(len(self.FIB_RATIOS), dtype=np.float64)
+        self._resistance_buf = np.empty(len(self.FIB_RATIOS), dtype=np.float64)
+        
+        # Last swing points with the frame they came from, keyed by
+        # (len(df), last index label, last high, last low, last close)
+        self._swing_cache = None
+        
+        # Memoized levels: (swing_high, swing_low) -> (fib_levels, ascending level array),
+        # and the support/resistance split keyed by (swing_high, swing_low, levels below price)
+        self._levels_cache: Dict[Tuple[float, float], Tuple[Dict[float, float], np.ndarray]] = {}
+        self._partition_cache: Dict[Tuple[float, float, int], Dict[str, List[float]]] = {}
+        
+        # Warm the kernels up once per process so the first signal does not wait for numba
+        warm_up_in_background(_warm_up_kernels)
     
     def calculate_fib_levels(self, high: float, low: float) -> Dict[float, float]:
         """
@@ -32,18 +167,8 @@ class FibonacciStrategy:
         Returns:
             Dictionary mapping Fibonacci ratios to price levels
         """
-        price_range = high - low
-        levels = {}
-        
-        for ratio in self.FIB_RATIOS:
-            if ratio == 0:
-                levels[ratio] = low
-            elif ratio == 1:
-                levels[ratio] = high
-            else:
-                levels[ratio] = high - (price_range * ratio)
-                
-        return levels
+        _fib_levels_nb(float(high), float(low), FIB_RATIOS, self._fib_levels_buf)
+        return dict(zip(self.FIB_RATIOS, self._fib_levels_buf.tolist()))
     
     def find_swing_points(self, df: pd.DataFrame) -> Tuple[float, float]:
         """
@@ -55,10 +180,24 @@ class FibonacciStrategy:
         Returns:
             Tuple of (swing_high, swing_low)
         """
+        # Reuse the result if this exact frame was just analysed; the last bar's prices are
+        # part of the key because a forming bar is updated in place. The cache holds the
+        # frame itself, so its id cannot be reused by another frame
+        if len(df):
+            key = (len(df), df.index[-1], df['high'].iat[-1], df['low'].iat[-1], df['close'].iat[-1])
+        else:
+            key = (0,)
+        cached = self._swing_cache
+        if cached is not None and cached[0] is df and cached[1] == key:
+            return cached[2]
+        
         # Simple implementation - can be enhanced with more sophisticated algorithms
-        high = df['high'].max()
-        low = df['low'].min()
-        return high, low
+        swing_points = _swing_extremes_nb(
+            np.ascontiguousarray(df['high'].to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(df['low'].to_numpy(dtype=np.float64))
+        )
+        self._swing_cache = (df, key, swing_points)
+        return swing_points
     
     def identify_support_resistance(self, current_price: float, fib_levels: Dict[float, float]) -> Dict[str, List[float]]:
         """
@@ -71,20 +210,101 @@ class FibonacciStrategy:
         Returns:
             Dictionary with 'support' and 'resistance' lists
         """
-        support_levels = []
-        resistance_levels = []
-        
-        for ratio, level in fib_levels.items():
-            if level < current_price:
-                support_levels.append(level)
-            else:
-                resistance_levels.append(level)
+        levels = np.fromiter(fib_levels.values(), dtype=np.float64, count=len(fib_levels))
+        is_support = levels < current_price
                 
         return {
-            'support': sorted(support_levels, reverse=True),
-            'resistance': sorted(resistance_levels)
+            'support': np.sort(levels[is_support])[::-1].tolist(),
+            'resistance': np.sort(levels[~is_support]).tolist()
         }
     
+    def nearest_levels(self, current_price: float, fib_levels: Dict[float, float]) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Find the nearest support below and resistance at or above the current price
+        without sorting the levels.
+        
+        Args:
+            current_price: Current market price
+            fib_levels: Dictionary of Fibonacci levels
+            
+        Returns:
+            Tuple of (nearest_support, nearest_resistance), None where there is no level
+        """
+        levels = np.fromiter(fib_levels.values(), dtype=np.float64, count=len(fib_levels))
+        is_support = levels < current_price
+        support = levels[is_support]
+        resistance = levels[~is_support]
+        
+        return (
+            float(support.max()) if support.size else None,
+            float(resistance.min()) if resistance.size else None
+        )
+    
+    # Maximum number of entries kept in each memo before it is reset
+    _CACHE_SIZE = 256
+    
+    def _fused_levels(self, swing_high: float, swing_low: float,
+                      current_price: float) -> Tuple[Dict[float, float], np.ndarray, Dict[str, List[float]]]:
+        """
+        Compute the levels and their support/resistance split for a new swing range
+        with a single kernel call, seeding both memos.
+        
+        Args:
+            swing_high: The swing high price
+            swing_low: The swing low price
+            current_price: Current market price
+            
+        Returns:
+            Tuple of (fib_levels dict, ascending array of the level values,
+            dictionary with 'support' and 'resistance' lists)
+        """
+        if len(self._levels_cache) >= self._CACHE_SIZE:
+            self._levels_cache.clear()
+            self._partition_cache.clear()
+        
+        n_support, n_resistance, _, _ = _fib_pipeline(
+            float(swing_high), float(swing_low), float(current_price), FIB_RATIOS,
+            self._fib_levels_buf, self._support_buf, self._resistance_buf
+        )
+        support = self._support_buf[:n_support]
+        resistance = self._resistance_buf[:n_resistance]
+        
+        # Re-materialize the dict and lists only at the API boundary
+        fib_levels = dict(zip(self.FIB_RATIOS, self._fib_levels_buf.tolist()))
+        sorted_levels = np.concatenate((support[::-1], resistance))
+        levels = {'support': support.tolist(), 'resistance': resistance.tolist()}
+        
+        self._levels_cache[(swing_high, swing_low)] = (fib_levels, sorted_levels)
+        self._partition_cache[(swing_high, swing_low, n_support)] = levels
+        return fib_levels, sorted_levels, levels
+    
+    def _memoized_partition(self, swing_high: float, swing_low: float, sorted_levels: np.ndarray,
+                            current_price: float) -> Dict[str, List[float]]:
+        """
+        Get the support/resistance split of the levels around the current price.
+        The split only depends on how many levels lie below the price, so prices
+        between the same two levels share one memo entry.
+        
+        Args:
+            swing_high: The swing high price
+            swing_low: The swing low price
+            sorted_levels: Ascending array of the level values
+            current_price: Current market price
+            
+        Returns:
+            Dictionary with 'support' and 'resistance' lists, as from identify_support_resistance
+        """
+        below = int(np.searchsorted(sorted_levels, current_price))
+        key = (swing_high, swing_low, below)
+        levels = self._partition_cache.get(key)
+        if levels is None:
+            levels = {
+                'support': sorted_levels[:below][::-1].tolist(),
+                'resistance': sorted_levels[below:].tolist()
+            }
+            self._partition_cache[key] = levels
+        return levels
+    
     def generate_signal(self, df: pd.DataFrame, current_price: float) -> Dict:
         """
         Generate trading signal based on Fibonacci retracement analysis.
@@ -99,11 +319,13 @@ class FibonacciStrategy:
         # Find swing points
         swing_high, swing_low = self.find_swing_points(df)
         
-        # Calculate Fibonacci levels
-        fib_levels = self.calculate_fib_levels(swing_high, swing_low)
-        
-        # Identify support and resistance
-        levels = self.identify_support_resistance(current_price, fib_levels)
+        # Calculate Fibonacci levels and identify support and resistance
+        cached = self._levels_cache.get((swing_high, swing_low))
+        if cached is None:
+            fib_levels, sorted_levels, levels = self._fused_levels(swing_high, swing_low, current_price)
+        else:
+            fib_levels, sorted_levels = cached
+            levels = self._memoized_partition(swing_high, swing_low, sorted_levels, current_price)
         
         # Determine signal
         nearest_support = levels['support'][0] if levels['support'] else None
@@ -117,19 +339,23 @@ class FibonacciStrategy:
         signal = {
             'action': 'HOLD',
             'confidence': 0.0,
-            'support_levels': levels['support'],
-            'resistance_levels': levels['resistance'],
+            'support_levels': list(levels['support']),
+            'resistance_levels': list(levels['resistance']),
             'nearest_support': nearest_support,
             'nearest_resistance': nearest_resistance,
-            'fib_levels': fib_levels
+            'fib_levels': dict(fib_levels)
         }
         
         # Simple signal logic - can be enhanced
+        # HOLD is the common case, so check the nearer level once and return early
+        nearest_distance = support_distance if support_distance < resistance_distance else resistance_distance
+        if not nearest_distance < 0.01:
+            return signal
+        
         if support_distance < 0.01:  # Within 1% of support
             signal['action'] = 'BUY'
-            signal['confidence'] = 0.7
-        elif resistance_distance < 0.01:  # Within 1% of resistance
+        else:  # Within 1% of resistance
             signal['action'] = 'SELL'
-            signal['confidence'] = 0.7
+        signal['confidence'] = 0.7
             
         return signal 
\ No newline at end of file
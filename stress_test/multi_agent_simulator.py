@@ -2,10 +2,26 @@ import random
 import time
 import threading
 import logging
+import multiprocessing
 import json
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Outcome codes of a simulated operation
+OUTCOME_SUCCESS = 0
+OUTCOME_MISSING_DATA = 1
+OUTCOME_FAILED = 2
 
 # Remove global logging configuration as it's handled in run_stress_test.py
 # logging.basicConfig(
@@ -14,6 +30,112 @@ from typing import List, Dict, Any, Optional
 #     format='%(asctime)s - %(levelname)s - %(message)s'
 # )
 
+def _simulate_agent(
+    agent_name: str,
+    tasks: List[str],
+    operations: int,
+    min_delay: float,
+    max_delay: float,
+    missing_data_prob: float,
+    failure_prob: float
+) -> Tuple[Dict[str, int], List[str], List[int]]:
+    """
+    Simulate actions for a single agent without touching shared state, so it can
+    run in a worker thread or process.
+    
+    Args:
+        agent_name: Name of the agent to simulate
+        tasks: List of tasks to perform
+        operations: Number of operations the agent performs
+        min_delay: Minimum delay between operations in seconds
+        max_delay: Maximum delay between operations in seconds
+        missing_data_prob: Probability of missing data (0.0-1.0)
+        failure_prob: Probability of task failure (0.0-1.0)
+        
+    Returns:
+        Tuple of (operation counts, tasks of the successful operations,
+        their epoch nanosecond timestamps)
+    """
+    # Check the log levels once; disabled levels skip the logging call entirely
+    log_info = logger.isEnabledFor(logging.INFO)
+    log_warning = logger.isEnabledFor(logging.WARNING)
+    log_error = logger.isEnabledFor(logging.ERROR)
+    
+    # Draw every delay, task and outcome for this agent up front, from generators
+    # owned by this agent and seeded from OS entropy rather than the shared module state
+    n = operations
+    rnd = random.Random()
+    rng = np.random.default_rng()
+    delays = rng.uniform(min_delay, max_delay, n)
+    outcomes = np.where(
+        rng.random(n) < missing_data_prob,
+        OUTCOME_MISSING_DATA,
+        np.where(rng.random(n) < failure_prob, OUTCOME_FAILED, OUTCOME_SUCCESS)
+    ).astype(np.uint8)
+    chosen_tasks = rnd.choices(tasks, k=n)
+    
+    # Count and log locally; the caller merges the results into shared state
+    successful = failed = missing = 0
+    local_tasks = [None] * n
+    local_timestamps = [None] * n
+    
+    # Sleep until each operation's deadline so the schedule does not drift
+    deadline = time.monotonic()
+    for delay, outcome, task in zip(delays.tolist(), outcomes.tolist(), chosen_tasks):
+        deadline += delay
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        
+        if outcome == OUTCOME_SUCCESS:
+            # Simulate success and memory push
+            local_tasks[successful] = task
+            local_timestamps[successful] = time.time_ns()
+            if log_info:
+                logger.info("%s successfully completed %s", agent_name, task)
+            successful += 1
+        elif outcome == OUTCOME_MISSING_DATA:
+            # Simulate missing data
+            if log_warning:
+                logger.warning("%s encountered missing data during %s task.", agent_name, task)
+            missing += 1
+        else:
+            # Simulate failure
+            if log_error:
+                logger.error("%s failed to complete %s task.", agent_name, task)
+            failed += 1
+    
+    counts = {
+        "total_operations": n,
+        "successful_operations": successful,
+        "failed_operations": failed,
+        "missing_data_events": missing
+    }
+    return counts, local_tasks[:successful], local_timestamps[:successful]
+
+def _run_agent(args: Tuple) -> Tuple[Dict[str, int], List[str], List[int]]:
+    """Process-pool entry point: unpack the parameters and simulate one agent."""
+    return _simulate_agent(*args)
+
+def _init_worker_logging(log_queue, level: int) -> None:
+    """
+    Process-pool initializer: send the worker's log records to the parent over log_queue.
+    
+    Args:
+        log_queue: Queue shared with the parent process
+        level: Root logging level of the parent process
+    """
+    root = logging.getLogger()
+    # Handlers inherited through fork would write into copies nothing drains
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+class _ParentLogHandler(logging.Handler):
+    """Re-dispatch records received from worker processes to the parent's loggers."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
 class MultiAgentSimulator:
     """
     A simulator for testing multi-agent trading systems under stress conditions.
@@ -28,7 +150,8 @@ class MultiAgentSimulator:
         operations_per_agent: int = 100,
         min_delay: float = 0.05,
         max_delay: float = 0.15,
-        output_dir: str = "stress_test_output"
+        output_dir: str = "stress_test_output",
+        backend: str = "thread"
     ):
         """
         Initialize the multi-agent simulator.
@@ -42,7 +165,12 @@ class MultiAgentSimulator:
             min_delay: Minimum delay between operations in seconds
             max_delay: Maximum delay between operations in seconds
             output_dir: Directory to store output files
+            backend: "thread" to run agents on a thread pool, or "process" to run
+                them on a process pool for CPU-bound (near-zero delay) runs
         """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        
         self.agents = agents or ["StockAgent_A", "ForexAgent_B", "CryptoAgent_C", "ArbitrageAgent_D"]
         self.tasks = tasks or ["buy", "sell", "hedge", "rebalance"]
         self.missing_data_prob = missing_data_prob
@@ -51,12 +179,18 @@ class MultiAgentSimulator:
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.output_dir = output_dir
+        self.backend = backend
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Initialize memory log
-        self.memory_log = []
+        # Initialize memory log as parallel agent/task/timestamp columns;
+        # timestamps are epoch nanoseconds until the snapshot is written
+        self.memory_log = {"agent": [], "task": [], "timestamp": []}
+        
+        # Guard the shared statistics and memory log when agents merge their results
+        self._stats_lock = threading.Lock()
+        self._log_lock = threading.Lock()
         
         # Statistics
         self.stats = {
@@ -66,6 +200,8 @@ class MultiAgentSimulator:
             "missing_data_events": 0,
             "start_time": None,
             "end_time": None,
+            "start_monotonic": None,
+            "end_monotonic": None,
             "agent_stats": {}
         }
         
@@ -85,41 +221,38 @@ class MultiAgentSimulator:
         Args:
             agent_name: Name of the agent to simulate
         """
-        for _ in range(self.operations_per_agent):
-            task = random.choice(self.tasks)
-            delay = random.uniform(self.min_delay, self.max_delay)
-            time.sleep(delay)
-            
-            # Update statistics
-            self.stats["total_operations"] += 1
-            self.stats["agent_stats"][agent_name]["total_operations"] += 1
-            
-            # Simulate missing data
-            if random.random() < self.missing_data_prob:
-                logging.warning(f"{agent_name} encountered missing data during {task} task.")
-                self.stats["missing_data_events"] += 1
-                self.stats["agent_stats"][agent_name]["missing_data_events"] += 1
-                continue
-            
-            # Simulate failure
-            if random.random() < self.failure_prob:
-                logging.error(f"{agent_name} failed to complete {task} task.")
-                self.stats["failed_operations"] += 1
-                self.stats["agent_stats"][agent_name]["failed_operations"] += 1
-                continue
-            
-            # Simulate success and memory push
-            result = f"{agent_name} successfully completed {task}"
-            self.memory_log.append({
-                "agent": agent_name,
-                "task": task,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            logging.info(result)
-            
-            # Update success statistics
-            self.stats["successful_operations"] += 1
-            self.stats["agent_stats"][agent_name]["successful_operations"] += 1
+        self._merge_agent_result(agent_name, *_simulate_agent(
+            agent_name,
+            self.tasks,
+            self.operations_per_agent,
+            self.min_delay,
+            self.max_delay,
+            self.missing_data_prob,
+            self.failure_prob
+        ))
+    
+    def _merge_agent_result(self, agent_name: str, counts: Dict[str, int],
+                            tasks: List[str], timestamps: List[int]) -> None:
+        """
+        Fold one agent's counts and memory log into the shared statistics and log.
+        
+        Args:
+            agent_name: Name of the simulated agent
+            counts: The agent's operation counts, keyed like its agent_stats entry
+            tasks: Tasks of the agent's successful operations
+            timestamps: Epoch nanosecond timestamps of those operations
+        """
+        with self._log_lock:
+            self.memory_log["agent"].extend([agent_name] * len(tasks))
+            self.memory_log["task"].extend(tasks)
+            self.memory_log["timestamp"].extend(timestamps)
+        
+        # Update statistics
+        with self._stats_lock:
+            agent_stats = self.stats["agent_stats"][agent_name]
+            for key, count in counts.items():
+                self.stats[key] += count
+                agent_stats[key] += count
     
     def run_simulation(self) -> Dict[str, Any]:
         """
@@ -129,31 +262,59 @@ class MultiAgentSimulator:
             Dict[str, Any]: Simulation statistics
         """
         self.stats["start_time"] = datetime.utcnow().isoformat()
+        self.stats["start_monotonic"] = time.monotonic()
         
-        # Launch threads for stress
-        threads = []
-        for agent in self.agents:
-            t = threading.Thread(target=self.simulate_agent_action, args=(agent,))
-            threads.append(t)
-            t.start()
-        
-        # Join all threads
-        for t in threads:
-            t.join()
+        # Run the agents on a pool and wait for all of them
+        if self.backend == "process":
+            # CPU-bound workers gain nothing beyond one process per core
+            max_workers = min(len(self.agents), os.cpu_count() or 4)
+            params = [
+                (agent, self.tasks, self.operations_per_agent, self.min_delay, self.max_delay,
+                 self.missing_data_prob, self.failure_prob)
+                for agent in self.agents
+            ]
+            # Workers log through a manager queue; the listener hands their records to
+            # this process's handlers, and stopping it flushes whatever is still queued
+            with multiprocessing.Manager() as manager:
+                log_queue = manager.Queue()
+                listener = QueueListener(log_queue, _ParentLogHandler())
+                listener.start()
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_worker_logging,
+                        initargs=(log_queue, logging.getLogger().getEffectiveLevel())
+                    ) as executor:
+                        for agent, result in zip(self.agents, executor.map(_run_agent, params)):
+                            self._merge_agent_result(agent, *result)
+                finally:
+                    listener.stop()
+        else:
+            # Agents spend their time sleeping, so every agent gets its own thread
+            with ThreadPoolExecutor(max_workers=len(self.agents), thread_name_prefix='agent') as executor:
+                list(executor.map(self.simulate_agent_action, self.agents))
         
+        self.stats["end_monotonic"] = time.monotonic()
         self.stats["end_time"] = datetime.utcnow().isoformat()
         
         # Save memory snapshot
         memory_snapshot_path = os.path.join(self.output_dir, "agent_memory_snapshot.json")
-        with open(memory_snapshot_path, "w") as f:
-            json.dump(self.memory_log, f, indent=2)
+        memory_snapshot = pd.DataFrame(self.memory_log)
+        memory_snapshot["timestamp"] = pd.to_datetime(
+            memory_snapshot["timestamp"], unit="ns"
+        ).dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+        memory_snapshot.to_json(memory_snapshot_path, orient="records", indent=2)
         
         # Save statistics
         stats_path = os.path.join(self.output_dir, "simulation_statistics.json")
-        with open(stats_path, "w") as f:
-            json.dump(self.stats, f, indent=2)
+        if orjson is not None:
+            with open(stats_path, "wb") as f:
+                f.write(orjson.dumps(self.stats, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(stats_path, "w") as f:
+                json.dump(self.stats, f, indent=2)
         
-        logging.info(f"Stress test completed. Logs and memory snapshot generated in {self.output_dir}.")
+        logger.info("Stress test completed. Logs and memory snapshot generated in %s.", self.output_dir)
         return self.stats
 
 def run_stress_test(
@@ -164,7 +325,8 @@ def run_stress_test(
     operations_per_agent: int = 100,
     min_delay: float = 0.05,
     max_delay: float = 0.15,
-    output_dir: str = "stress_test_output"
+    output_dir: str = "stress_test_output",
+    backend: str = "thread"
 ) -> Dict[str, Any]:
     """
     Run a stress test with the specified parameters.
@@ -178,6 +340,7 @@ def run_stress_test(
         min_delay: Minimum delay between operations in seconds
         max_delay: Maximum delay between operations in seconds
         output_dir: Directory to store output files
+        backend: "thread" or "process" agent execution
         
     Returns:
         Dict[str, Any]: Simulation statistics
@@ -190,7 +353,8 @@ def run_stress_test(
         operations_per_agent=operations_per_agent,
         min_delay=min_delay,
         max_delay=max_delay,
-        output_dir=output_dir
+        output_dir=output_dir,
+        backend=backend
     )
     
     return simulator.run_simulation()
@@ -7,7 +7,9 @@ This script runs the multi-agent stress test with configurable parameters.
 
 import argparse
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 
@@ -35,6 +37,8 @@ def parse_args():
                         help="Minimum delay between operations in seconds")
     parser.add_argument("--max-delay", type=float, default=0.15,
                         help="Maximum delay between operations in seconds")
+    parser.add_argument("--backend", choices=["thread", "process"], default="thread",
+                        help="Run agents on a thread pool or, for CPU-bound runs, a process pool")
     
     # Output settings
     parser.add_argument("--output-dir", default="stress_test_output",
@@ -56,15 +60,26 @@ def main():
     log_file = os.path.join(args.output_dir, f"stress_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
     os.makedirs(args.output_dir, exist_ok=True)
     
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Agent threads only enqueue records; a listener thread formats and writes them
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
     
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    logging.basicConfig(level=getattr(logging, args.log_level), handlers=[queue_handler])
+    listener.start()
+    
+    try:
+        return _run(args)
+    finally:
+        listener.stop()
+
+def _run(args):
+    """Run the stress test and report the results."""
     logger = logging.getLogger(__name__)
     logger.info("Starting NOS Trade multi-agent stress test")
     logger.info(f"Output directory: {args.output_dir}")
@@ -79,7 +94,8 @@ def main():
             operations_per_agent=args.operations,
             min_delay=args.min_delay,
             max_delay=args.max_delay,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            backend=args.backend
         )
         
         # Print summary
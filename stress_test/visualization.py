@@ -1,10 +1,46 @@
+import io
 import json
+import mmap
 import os
-import matplotlib.pyplot as plt
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+def _load_json(path: str) -> Any:
+    """
+    Parse a JSON file, memory-mapping large files so orjson reads the mapped
+    bytes without an intermediate copy.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Any: Parsed JSON content
+    """
+    if orjson is None:
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
 def load_simulation_data(output_dir: str = "stress_test_output") -> Dict[str, Any]:
     """
     Load simulation data from the output directory.
@@ -21,13 +57,11 @@ def load_simulation_data(output_dir: str = "stress_test_output") -> Dict[str, An
     if not os.path.exists(stats_path):
         raise FileNotFoundError(f"Statistics file not found: {stats_path}")
     
-    with open(stats_path, "r") as f:
-        stats = json.load(f)
+    stats = _load_json(stats_path)
     
     memory_data = []
     if os.path.exists(memory_path):
-        with open(memory_path, "r") as f:
-            memory_data = json.load(f)
+        memory_data = _load_json(memory_path)
     
     return {
         "stats": stats,
@@ -43,6 +77,46 @@ def _ensure_output_dir(output_dir: str) -> None:
     """
     os.makedirs(output_dir, exist_ok=True)
 
+def _save_figure(fig: Figure, output_dir: str, filename: str) -> None:
+    """
+    Render a figure to a PNG file with the Agg canvas.
+    
+    Args:
+        fig: Figure to render
+        output_dir: Directory to save the plot
+        filename: Name of the PNG file
+    """
+    # Encode in memory, then write the file with a single unbuffered write
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf)
+    
+    _ensure_output_dir(output_dir)
+    fd = os.open(os.path.join(output_dir, filename), os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        data = buf.getbuffer()
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+def _sync_directory(output_dir: str) -> None:
+    """
+    Flush the directory entries of the report files to disk with one fsync.
+    Skipped on platforms that cannot open directories (Windows).
+    
+    Args:
+        output_dir: Directory containing the report files
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    
+    dir_fd = os.open(output_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
 def plot_operation_results(stats: Dict[str, Any], output_dir: str = "stress_test_output") -> None:
     """
     Plot operation results as a pie chart.
@@ -59,15 +133,14 @@ def plot_operation_results(stats: Dict[str, Any], output_dir: str = "stress_test
     ]
     colors = ["#4CAF50", "#F44336", "#FFC107"]
     
-    plt.figure(figsize=(10, 8))
-    plt.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-    plt.axis('equal')
-    plt.title("Operation Results")
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+    ax.axis('equal')
+    ax.set_title("Operation Results")
     
     # Save the plot
-    _ensure_output_dir(output_dir)
-    plt.savefig(os.path.join(output_dir, "operation_results.png"))
-    plt.close()
+    _save_figure(fig, output_dir, "operation_results.png")
 
 def plot_agent_performance(stats: Dict[str, Any], output_dir: str = "stress_test_output") -> None:
     """
@@ -85,139 +158,120 @@ def plot_agent_performance(stats: Dict[str, Any], output_dir: str = "stress_test
     x = range(len(agents))
     width = 0.25
     
-    plt.figure(figsize=(12, 8))
-    plt.bar([i - width for i in x], successful, width, label="Successful", color="#4CAF50")
-    plt.bar(x, failed, width, label="Failed", color="#F44336")
-    plt.bar([i + width for i in x], missing, width, label="Missing Data", color="#FFC107")
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    ax.bar([i - width for i in x], successful, width, label="Successful", color="#4CAF50")
+    ax.bar(x, failed, width, label="Failed", color="#F44336")
+    ax.bar([i + width for i in x], missing, width, label="Missing Data", color="#FFC107")
     
-    plt.xlabel("Agents")
-    plt.ylabel("Number of Operations")
-    plt.title("Agent Performance")
-    plt.xticks(x, agents, rotation=45)
-    plt.legend()
-    plt.tight_layout()
+    ax.set_xlabel("Agents")
+    ax.set_ylabel("Number of Operations")
+    ax.set_title("Agent Performance")
+    ax.set_xticks(x)
+    ax.set_xticklabels(agents, rotation=45)
+    ax.legend()
+    fig.tight_layout()
     
     # Save the plot
-    _ensure_output_dir(output_dir)
-    plt.savefig(os.path.join(output_dir, "agent_performance.png"))
-    plt.close()
+    _save_figure(fig, output_dir, "agent_performance.png")
 
-def plot_task_distribution(memory_data: List[Dict[str, Any]], output_dir: str = "stress_test_output") -> None:
+def plot_task_distribution(df: pd.DataFrame, output_dir: str = "stress_test_output") -> None:
     """
     Plot task distribution as a bar chart.
     
     Args:
-        memory_data: Memory snapshot data
+        df: Memory snapshot data with parsed timestamps
         output_dir: Directory to save the plot
     """
-    if not memory_data:
+    if df.empty:
         return
     
-    # Convert to DataFrame for easier analysis
-    df = pd.DataFrame(memory_data)
+    # Count tasks, most common first
+    labels, values = zip(*Counter(df["task"].tolist()).most_common())
     
-    # Count tasks
-    task_counts = df["task"].value_counts()
-    
-    plt.figure(figsize=(10, 8))
-    task_counts.plot(kind="bar", color="#2196F3")
-    plt.xlabel("Task")
-    plt.ylabel("Count")
-    plt.title("Task Distribution")
-    plt.tight_layout()
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    ax.bar([str(label) for label in labels], values, color="#2196F3")
+    ax.tick_params(axis="x", labelrotation=90)
+    ax.set_xlabel("Task")
+    ax.set_ylabel("Count")
+    ax.set_title("Task Distribution")
+    fig.tight_layout()
     
     # Save the plot
-    _ensure_output_dir(output_dir)
-    plt.savefig(os.path.join(output_dir, "task_distribution.png"))
-    plt.close()
+    _save_figure(fig, output_dir, "task_distribution.png")
 
-def plot_agent_task_heatmap(memory_data: List[Dict[str, Any]], output_dir: str = "stress_test_output") -> None:
+def plot_agent_task_heatmap(df: pd.DataFrame, output_dir: str = "stress_test_output") -> None:
     """
     Plot agent-task heatmap.
     
     Args:
-        memory_data: Memory snapshot data
+        df: Memory snapshot data with parsed timestamps
         output_dir: Directory to save the plot
     """
-    if not memory_data:
+    if df.empty:
         return
     
-    # Convert to DataFrame for easier analysis
-    df = pd.DataFrame(memory_data)
-    
-    # Create a pivot table
-    pivot = pd.pivot_table(
-        df, 
-        values="timestamp", 
-        index="agent", 
-        columns="task", 
-        aggfunc="count",
-        fill_value=0
-    )
-    
-    plt.figure(figsize=(12, 8))
-    plt.imshow(pivot, cmap="YlOrRd", aspect="auto")
-    plt.colorbar(label="Count")
-    plt.xlabel("Task")
-    plt.ylabel("Agent")
-    plt.title("Agent-Task Heatmap")
-    plt.xticks(range(len(pivot.columns)), pivot.columns, rotation=45)
-    plt.yticks(range(len(pivot.index)), pivot.index)
-    plt.tight_layout()
+    # Count operations per (agent, task) pair into a sorted agent x task matrix
+    pair_counts = Counter(zip(df["agent"].tolist(), df["task"].tolist()))
+    agents = sorted({agent for agent, _ in pair_counts})
+    tasks = sorted({task for _, task in pair_counts})
+    agent_index = {agent: i for i, agent in enumerate(agents)}
+    task_index = {task: i for i, task in enumerate(tasks)}
+    
+    counts = np.zeros((len(agents), len(tasks)), dtype=np.int64)
+    for (agent, task), count in pair_counts.items():
+        counts[agent_index[agent], task_index[task]] = count
+    
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    image = ax.imshow(counts, cmap="YlOrRd", aspect="auto")
+    fig.colorbar(image, ax=ax, label="Count")
+    ax.set_xlabel("Task")
+    ax.set_ylabel("Agent")
+    ax.set_title("Agent-Task Heatmap")
+    ax.set_xticks(range(len(tasks)))
+    ax.set_xticklabels(tasks, rotation=45)
+    ax.set_yticks(range(len(agents)))
+    ax.set_yticklabels(agents)
+    fig.tight_layout()
     
     # Save the plot
-    _ensure_output_dir(output_dir)
-    plt.savefig(os.path.join(output_dir, "agent_task_heatmap.png"))
-    plt.close()
+    _save_figure(fig, output_dir, "agent_task_heatmap.png")
 
-def plot_timeline(memory_data: List[Dict[str, Any]], output_dir: str = "stress_test_output") -> None:
+def plot_timeline(df: pd.DataFrame, output_dir: str = "stress_test_output") -> None:
     """
     Plot operation timeline.
     
     Args:
-        memory_data: Memory snapshot data
+        df: Memory snapshot data with parsed timestamps
         output_dir: Directory to save the plot
     """
-    if not memory_data:
+    if df.empty:
         return
     
-    # Convert to DataFrame for easier analysis
-    df = pd.DataFrame(memory_data)
-    
-    # Convert timestamps to datetime
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    
     # Sort by timestamp
     df = df.sort_values("timestamp")
     
     # Create a scatter plot
-    plt.figure(figsize=(15, 8))
-    
-    # Plot each agent with a different color
-    agents = df["agent"].unique()
-    colors = plt.cm.tab10.colors
-    
-    for i, agent in enumerate(agents):
-        agent_data = df[df["agent"] == agent]
-        plt.scatter(
-            agent_data["timestamp"], 
-            [i] * len(agent_data), 
-            label=agent,
-            color=colors[i % len(colors)],
-            alpha=0.7
-        )
-    
-    plt.xlabel("Time")
-    plt.ylabel("Agent")
-    plt.title("Operation Timeline")
-    plt.yticks(range(len(agents)), agents)
-    plt.grid(True, axis="x", linestyle="--", alpha=0.7)
-    plt.tight_layout()
+    fig = Figure(figsize=(15, 8))
+    ax = fig.subplots()
+    
+    # Plot each agent on its own row and color, in order of first appearance, with one call
+    codes, agents = pd.factorize(df["agent"])
+    colors = np.asarray(matplotlib.colormaps["tab10"].colors)
+    ax.scatter(df["timestamp"], codes, c=colors[codes % len(colors)], alpha=0.7)
+    
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Agent")
+    ax.set_title("Operation Timeline")
+    ax.set_yticks(range(len(agents)))
+    ax.set_yticklabels(agents)
+    ax.grid(True, axis="x", linestyle="--", alpha=0.7)
+    fig.tight_layout()
     
     # Save the plot
-    _ensure_output_dir(output_dir)
-    plt.savefig(os.path.join(output_dir, "operation_timeline.png"))
-    plt.close()
+    _save_figure(fig, output_dir, "operation_timeline.png")
 
 def generate_visualization_report(output_dir: str = "stress_test_output") -> None:
     """
@@ -231,17 +285,34 @@ def generate_visualization_report(output_dir: str = "stress_test_output") -> Non
     stats = data["stats"]
     memory_data = data["memory"]
     
-    # Generate plots
-    plot_operation_results(stats, output_dir)
-    plot_agent_performance(stats, output_dir)
-    
+    # Generate plots concurrently; each renders its own Agg figure
+    # Convert the memory snapshot to a DataFrame once and share it between plots
     if memory_data:
-        plot_task_distribution(memory_data, output_dir)
-        plot_agent_task_heatmap(memory_data, output_dir)
-        plot_timeline(memory_data, output_dir)
+        memory_df = pd.DataFrame(memory_data)
+        memory_df["timestamp"] = pd.to_datetime(memory_df["timestamp"])
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(plot_operation_results, stats, output_dir),
+            executor.submit(plot_agent_performance, stats, output_dir)
+        ]
+        
+        if memory_data:
+            futures += [
+                executor.submit(plot_task_distribution, memory_df, output_dir),
+                executor.submit(plot_agent_task_heatmap, memory_df, output_dir),
+                executor.submit(plot_timeline, memory_df, output_dir)
+            ]
+        
+        # Surface any plotting error
+        for future in futures:
+            future.result()
     
     # Generate HTML report
     generate_html_report(stats, memory_data, output_dir)
+    
+    # Sync the directory once for all report files
+    _sync_directory(output_dir)
 
 def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]], output_dir: str) -> None:
     """
@@ -258,13 +329,17 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
     failure_rate = (stats["failed_operations"] / total_ops) * 100 if total_ops > 0 else 0
     missing_rate = (stats["missing_data_events"] / total_ops) * 100 if total_ops > 0 else 0
     
-    # Calculate duration
-    start_time = datetime.fromisoformat(stats["start_time"])
-    end_time = datetime.fromisoformat(stats["end_time"])
-    duration = end_time - start_time
-    
-    # Create HTML content
-    html_content = f"""
+    # Calculate duration from the monotonic clock readings; older statistics
+    # files only carry the ISO timestamps
+    if stats.get("end_monotonic") is not None:
+        duration_seconds = stats["end_monotonic"] - stats["start_monotonic"]
+    else:
+        duration_seconds = (
+            datetime.fromisoformat(stats["end_time"]) - datetime.fromisoformat(stats["start_time"])
+        ).total_seconds()
+    
+    # Collect the HTML content as a list of parts and write them out in one go
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -318,7 +393,7 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
                 </div>
                 <div class="stat-card">
                     <h3>Duration</h3>
-                    <div class="stat-value">{duration.total_seconds():.2f} seconds</div>
+                    <div class="stat-value">{duration_seconds:.2f} seconds</div>
                 </div>
             </div>
             
@@ -333,11 +408,11 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
                 <h3>Agent Performance</h3>
                 <img src="agent_performance.png" alt="Agent Performance">
             </div>
-    """
+    """]
     
     # Add memory visualizations if available
     if memory_data:
-        html_content += """
+        parts.append("""
             <div class="visualization">
                 <h3>Task Distribution</h3>
                 <img src="task_distribution.png" alt="Task Distribution">
@@ -352,10 +427,10 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
                 <h3>Operation Timeline</h3>
                 <img src="operation_timeline.png" alt="Operation Timeline">
             </div>
-        """
+        """)
     
     # Add agent statistics table
-    html_content += """
+    parts.append("""
             <h2>Agent Statistics</h2>
             <table>
                 <tr>
@@ -366,16 +441,29 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
                     <th>Missing Data</th>
                     <th>Success Rate</th>
                 </tr>
-    """
+    """)
     
-    for agent, agent_stats in stats["agent_stats"].items():
-        agent_total = agent_stats["total_operations"]
-        agent_success = agent_stats["successful_operations"]
-        agent_failed = agent_stats["failed_operations"]
-        agent_missing = agent_stats["missing_data_events"]
-        agent_success_rate = (agent_success / agent_total) * 100 if agent_total > 0 else 0
-        
-        html_content += f"""
+    # Compute every agent's success rate in one vectorized pass
+    agent_df = pd.DataFrame.from_dict(
+        stats["agent_stats"],
+        orient="index",
+        columns=["total_operations", "successful_operations", "failed_operations", "missing_data_events"]
+    )
+    totals = agent_df["total_operations"].to_numpy()
+    success_rates = np.divide(
+        agent_df["successful_operations"].to_numpy(), totals,
+        out=np.zeros(len(agent_df)), where=totals > 0
+    ) * 100
+    
+    for agent, agent_total, agent_success, agent_failed, agent_missing, agent_success_rate in zip(
+        agent_df.index,
+        totals.tolist(),
+        agent_df["successful_operations"].tolist(),
+        agent_df["failed_operations"].tolist(),
+        agent_df["missing_data_events"].tolist(),
+        success_rates.tolist()
+    ):
+        parts.append(f"""
                 <tr>
                     <td>{agent}</td>
                     <td>{agent_total}</td>
@@ -384,19 +472,19 @@ def generate_html_report(stats: Dict[str, Any], memory_data: List[Dict[str, Any]
                     <td class="warning">{agent_missing}</td>
                     <td>{agent_success_rate:.1f}%</td>
                 </tr>
-        """
+        """)
     
-    html_content += """
+    parts.append("""
             </table>
         </div>
     </body>
     </html>
-    """
+    """)
     
     # Save the HTML report
     _ensure_output_dir(output_dir)
     report_path = os.path.join(output_dir, "stress_test_report.html")
     with open(report_path, "w") as f:
-        f.write(html_content)
+        f.writelines(parts)
     
     print(f"HTML report generated: {report_path}") 
\ No newline at end of file
@@ -0,0 +1,44 @@
+import json
+import math
+import os
+import tempfile
+
+import numpy as np
+
+from trading_bot_executor import TradeExecutor
+
+def make_executor(**config):
+    """Create a TradeExecutor from a temporary config file."""
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(config, f)
+    try:
+        return TradeExecutor(f.name)
+    finally:
+        os.remove(f.name)
+
+def test_eviction_with_numpy_amount():
+    """A numpy-scalar amount is recorded and later evicted without wedging the executor."""
+    executor = make_executor(max_trade_history=3, max_slippage=1.0)
+    
+    assert executor.execute_order('BUY', 'BTC', np.float32(0.5)) is True
+    for _ in range(4):
+        assert executor.execute_order('BUY', 'BTC', 0.1) is True
+        
+    history = executor.get_trade_history()
+    assert len(history) == 3
+    assert all(type(trade['amount']) is float for trade in history)
+    assert executor.get_position('BTC')['position'] == math.fsum(trade['amount'] for trade in history)
+
+def test_positions_exact_after_eviction():
+    """Positions match an exact sum over the trades still in the history."""
+    executor = make_executor(max_trade_history=2, max_slippage=1.0)
+    
+    for action, amount in [('BUY', 0.1), ('BUY', 0.2), ('SELL', 0.3), ('SELL', 1e-7)]:
+        assert executor.execute_order(action, 'BTC', amount) is True
+        
+    assert executor.get_position('BTC')['position'] == -0.3000001
+
+if __name__ == "__main__":
+    test_eviction_with_numpy_amount()
+    test_positions_exact_after_eviction()
+    print("All TradeExecutor tests passed")
@@ -1,8 +1,39 @@
+import copy
 import logging
+import random
+import threading
 import time
-from typing import Dict, Any, Optional, List
-import json
+import uuid
+from collections import defaultdict, deque
+from dataclasses import asdict
+from fractions import Fraction
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
 import os
+from utils.data_models import OrderReceipt, TradeRecord
+
+# Valid actions and the sign each applies to a position
+_ACTION_SIGN: Dict[str, int] = {'BUY': 1, 'SELL': -1}
+
+# Parsed configs keyed by (path, mtime_ns, size), so an edited file is re-read
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def timestamp_seconds(ts_ns: int) -> float:
+    """
+    Convert a nanosecond trade timestamp to epoch seconds.
+    
+    Args:
+        ts_ns: Timestamp in nanoseconds, as recorded on a TradeRecord
+        
+    Returns:
+        Timestamp in seconds
+    """
+    return ts_ns * 1e-9
 
 class TradeExecutor:
     """
@@ -19,18 +50,47 @@ class TradeExecutor:
         # Set up logging
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
+        # Checked once so the execute paths skip building log arguments when INFO is off
+        self._log_info_enabled = self.logger.isEnabledFor(logging.INFO)
         
         # Load configuration
         self.config = self._load_config(config_path)
         
-        # Initialize trade history
-        self.trade_history = []
+        # Initialize trade history; the deque drops the oldest trade once full
         self.max_history_size = self.config.get('max_trade_history', 1000)
+        self.trade_history = deque(maxlen=self.max_history_size)
+        
+        # Backtests that only need the order results can skip history (and positions) entirely
+        self._record_history = bool(self.config.get('record_history', True))
+        
+        # Net position per symbol over the trades currently in the history
+        # Kept as exact fractions so adding trades and backing evicted ones out again
+        # accumulates no rounding error; reads match math.fsum over the held trades
+        self._positions: Dict[str, Fraction] = defaultdict(Fraction)
         
         # Initialize trade parameters
         self.default_symbol = self.config.get('default_symbol', 'BTC')
         self.default_amount = self.config.get('default_amount', 0.01)
         self.max_slippage = self.config.get('max_slippage', 0.02)  # 2% max slippage
+        self.exchange = self.config.get('exchange')  # Venue reported on real-order receipts
+        self._max_slip_sq = self.max_slippage * self.max_slippage
+        
+        # Own RNG for simulated prices; seed it for deterministic replays
+        self._rng = random.Random(self.config.get('random_seed'))
+        self._uniform = self._rng.uniform
+        
+        # Model order round-trip latency with blocking sleeps; off by default
+        self.simulate_latency = self.config.get('simulate_latency', False)
+        
+        # Resolve the execution path once; simulation_mode is fixed at construction
+        self._simulation_mode = bool(self.config.get('simulation_mode', True))
+        self._execute_impl = self._simulate_order if self._simulation_mode else self._execute_real_order
+        
+        # Real orders are submitted on one single-threaded worker per symbol,
+        # keeping each symbol's orders in FIFO order without blocking the caller
+        self._symbol_workers: Dict[str, ThreadPoolExecutor] = {}
+        self._pending_orders: Set[Future] = set()
+        self._workers_lock = threading.Lock()
         
         self.logger.info("TradeExecutor initialized")
         
@@ -50,7 +110,9 @@ class TradeExecutor:
             'default_amount': 0.01,
             'max_slippage': 0.02,
             'max_trade_history': 1000,
-            'simulation_mode': True
+            'simulation_mode': True,
+            'simulate_latency': False,
+            'record_history': True
         }
         
         # If no config path provided, use default
@@ -59,21 +121,30 @@ class TradeExecutor:
             
         # Try to load from file
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            st = os.stat(config_path)
+            cache_key = (config_path, st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+                
+            with open(config_path, 'rb') as f:
+                config = json_loads(f.read())
                 
             # Merge with default config
             for key, value in default_config.items():
                 if key not in config:
                     config[key] = value
                     
-            return config
+            _CONFIG_CACHE[cache_key] = config
+            return copy.deepcopy(config)
             
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        # Both json and orjson raise JSONDecodeError subclasses of ValueError
+        except (FileNotFoundError, ValueError) as e:
             self.logger.warning(f"Error loading configuration: {str(e)}. Using default configuration.")
             return default_config
             
-    def execute_order(self, action: str, symbol: Optional[str] = None, amount: Optional[float] = None) -> bool:
+    def execute_order(self, action: str, symbol: Optional[str] = None,
+                      amount: Optional[float] = None) -> Union[bool, OrderReceipt]:
         """
         Execute a trading order.
         
@@ -83,28 +154,56 @@ class TradeExecutor:
             amount: Trading amount (optional)
             
         Returns:
-            Boolean indicating success
+            Boolean indicating success in simulation mode; otherwise an OrderReceipt
+            with status 'pending' for the submitted order, or False if it was rejected
         """
         try:
             # Use defaults if not provided
             symbol = symbol or self.default_symbol
-            amount = amount or self.default_amount
+            # Positions are kept exact from float amounts, so coerce e.g. numpy scalars here
+            amount = float(amount or self.default_amount)
             
             # Validate action
-            if action not in ["BUY", "SELL"]:
-                self.logger.error(f"Invalid action: {action}")
+            if _ACTION_SIGN.get(action) is None:
+                self.logger.error("Invalid action: %s", action)
                 return False
                 
-            # Check if in simulation mode
-            if self.config.get('simulation_mode', True):
-                return self._simulate_order(action, symbol, amount)
-            else:
-                return self._execute_real_order(action, symbol, amount)
+            return self._execute_impl(action, symbol, amount)
                 
         except Exception as e:
-            self.logger.error(f"Error executing order: {str(e)}")
+            self.logger.error("Error executing order: %s", e)
             return False
             
+    def execute_orders(self, orders: List[Tuple[str, Optional[str], Optional[float]]]) -> List[Union[bool, OrderReceipt]]:
+        """
+        Execute several trading orders in one call, e.g. when rebalancing on a tick.
+        
+        Args:
+            orders: (action, symbol, amount) tuples; symbol and amount may be None for the defaults
+            
+        Returns:
+            Per-order results, as returned by execute_order
+        """
+        impl = self._execute_impl
+        default_symbol = self.default_symbol
+        default_amount = self.default_amount
+        action_sign = _ACTION_SIGN.get
+        
+        results = []
+        append = results.append
+        for action, symbol, amount in orders:
+            try:
+                if action_sign(action) is None:
+                    self.logger.error("Invalid action: %s", action)
+                    append(False)
+                    continue
+                append(impl(action, symbol or default_symbol, float(amount or default_amount)))
+            except Exception as e:
+                self.logger.error("Error executing order: %s", e)
+                append(False)
+                
+        return results
+            
     def _simulate_order(self, action: str, symbol: str, amount: float) -> bool:
         """
         Simulate a trading order.
@@ -118,41 +217,43 @@ class TradeExecutor:
             Boolean indicating success
         """
         # Simulate order execution delay
-        time.sleep(0.5)
+        if self.simulate_latency:
+            time.sleep(0.5)
         
         # Generate a simulated price with some randomness
-        import random
         base_price = 50000  # Example base price
-        price_variation = random.uniform(-0.01, 0.01)  # ±1% variation
+        price_variation = self._uniform(-0.01, 0.01)  # ±1% variation
         execution_price = base_price * (1 + price_variation)
         
-        # Calculate slippage
-        slippage = abs(price_variation)
-        if slippage > self.max_slippage:
-            self.logger.warning(f"Simulated slippage {slippage:.2%} exceeds maximum {self.max_slippage:.2%}")
+        # Check slippage on the squared variation; abs() is only needed for the record
+        if price_variation * price_variation > self._max_slip_sq:
+            self.logger.warning("Simulated slippage %.2f%% exceeds maximum %.2f%%",
+                                abs(price_variation) * 100, self.max_slippage * 100)
             return False
+        slippage = abs(price_variation)
             
         # Record the trade
-        trade = {
-            'timestamp': time.time(),
-            'action': action,
-            'symbol': symbol,
-            'amount': amount,
-            'price': execution_price,
-            'slippage': slippage,
-            'status': 'success'
-        }
-        
-        self._add_to_history(trade)
+        if self._record_history:
+            self._add_to_history(TradeRecord(
+                timestamp=time.time_ns(),
+                action=action,
+                symbol=symbol,
+                amount=amount,
+                price=execution_price,
+                slippage=slippage,
+                status='success'
+            ))
         
         # Log the trade
-        self.logger.info(f"Simulated {action} order executed: {amount} {symbol} at {execution_price:.2f} (slippage: {slippage:.2%})")
+        if self._log_info_enabled:
+            self.logger.info("Simulated %s order executed: %s %s at %.2f (slippage: %.2f%%)",
+                             action, amount, symbol, execution_price, slippage * 100)
         
         return True
         
-    def _execute_real_order(self, action: str, symbol: str, amount: float) -> bool:
+    def _execute_real_order(self, action: str, symbol: str, amount: float) -> OrderReceipt:
         """
-        Execute a real trading order.
+        Submit a real trading order to the symbol's worker and return immediately.
         
         Args:
             action: Trading action ("BUY" or "SELL")
@@ -160,56 +261,148 @@ class TradeExecutor:
             amount: Trading amount
             
         Returns:
-            Boolean indicating success
+            OrderReceipt with status 'pending'; its metadata holds the worker's future
         """
-        # This is a placeholder for real order execution
-        # In a real implementation, this would connect to a broker/exchange API
-        
-        self.logger.info(f"Executing real {action} order: {amount} {symbol}")
+        if self._log_info_enabled:
+            self.logger.info("Executing real %s order: %s %s", action, amount, symbol)
         
         # Record the trade
-        trade = {
-            'timestamp': time.time(),
-            'action': action,
-            'symbol': symbol,
-            'amount': amount,
-            'status': 'pending'
-        }
+        trade = TradeRecord(
+            timestamp=time.time_ns(),
+            action=action,
+            symbol=symbol,
+            amount=amount,
+            price=None,
+            slippage=0.0,
+            status='pending'
+        )
+        
+        if self._record_history:
+            self._add_to_history(trade)
+        
+        with self._workers_lock:
+            worker = self._symbol_workers.get(symbol)
+            if worker is None:
+                worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'order-{symbol}')
+                self._symbol_workers[symbol] = worker
+            future = worker.submit(self._submit_real_order, trade)
+            self._pending_orders.add(future)
+        future.add_done_callback(self._discard_pending_order)
+        
+        return OrderReceipt(
+            order_id=uuid.uuid4().hex,
+            symbol=symbol,
+            side=action,
+            quantity=amount,
+            price=None,
+            status='pending',
+            exchange=self.exchange,
+            metadata={'future': future}
+        )
+        
+    def _submit_real_order(self, trade: TradeRecord) -> TradeRecord:
+        """
+        Perform the broker round-trip for a recorded trade and update its status.
+        Runs on the trade's symbol worker.
         
-        self._add_to_history(trade)
+        Args:
+            trade: Trade recorded with status 'pending'
+            
+        Returns:
+            The updated trade
+        """
+        # This is a placeholder for real order execution
+        # In a real implementation, this would connect to a broker/exchange API
         
         # Simulate order execution
-        time.sleep(1)
+        if self.simulate_latency:
+            time.sleep(1)
         
         # Update trade status
-        trade['status'] = 'success'
-        trade['price'] = 50000  # Example price
+        trade.status = 'success'
+        trade.price = 50000  # Example price
         
-        self.logger.info(f"Real {action} order executed: {amount} {symbol}")
+        if self._log_info_enabled:
+            self.logger.info("Real %s order executed: %s %s", trade.action, trade.amount, trade.symbol)
         
-        return True
+        return trade
+        
+    def _discard_pending_order(self, future: Future):
+        """Forget a real order once its worker has finished with it."""
+        with self._workers_lock:
+            self._pending_orders.discard(future)
+            
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted real order has completed.
         
-    def _add_to_history(self, trade: Dict[str, Any]):
+        Args:
+            timeout: Maximum number of seconds to wait (optional)
+            
+        Returns:
+            Boolean indicating whether all pending orders completed
+        """
+        with self._workers_lock:
+            pending = list(self._pending_orders)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+        
+    def close(self):
+        """Wait for submitted real orders to complete, then shut down the symbol workers."""
+        self.drain()
+        with self._workers_lock:
+            workers = list(self._symbol_workers.values())
+            self._symbol_workers.clear()
+        for worker in workers:
+            worker.shutdown()
+        
+    def _add_to_history(self, trade: TradeRecord):
         """
         Add trade to history, maintaining the maximum history size.
         
         Args:
             trade: Trade to add to history
         """
+        # Compute the position changes before touching the history, so a bad trade
+        # cannot leave the history and the cached positions out of sync
+        delta = self._position_delta(trade)
+        evicted = None
+        if self.trade_history and len(self.trade_history) == self.trade_history.maxlen:
+            # Back out the trade the deque is about to evict
+            evicted = self.trade_history[0]
+            evicted_delta = self._position_delta(evicted)
+            
         self.trade_history.append(trade)
+        if evicted is not None:
+            self._positions[evicted.symbol] -= evicted_delta
+        self._positions[trade.symbol] += delta
+            
+    @staticmethod
+    def _position_delta(trade: TradeRecord) -> Fraction:
+        """
+        Get the exact change a trade makes to its symbol's position.
         
-        # Trim history if it exceeds the maximum size
-        if len(self.trade_history) > self.max_history_size:
-            self.trade_history = self.trade_history[-self.max_history_size:]
+        Args:
+            trade: Trade entering or leaving the history
+            
+        Returns:
+            Signed trade amount as a Fraction
+        """
+        return Fraction(_ACTION_SIGN[trade.action] * trade.amount)
             
     def get_trade_history(self) -> List[Dict[str, Any]]:
         """
         Get the trade history.
         
         Returns:
-            List of historical trades
+            List of historical trades as dictionaries, with timestamps in seconds
         """
-        return self.trade_history.copy()
+        history = []
+        for trade in self.trade_history:
+            record = asdict(trade)
+            record['timestamp'] = timestamp_seconds(trade.timestamp)
+            history.append(record)
+        return history
         
     def get_position(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -223,22 +416,23 @@ class TradeExecutor:
         """
         symbol = symbol or self.default_symbol
         
-        # Calculate position from trade history
-        position = 0.0
-        for trade in self.trade_history:
-            if trade['symbol'] == symbol:
-                if trade['action'] == 'BUY':
-                    position += trade['amount']
-                elif trade['action'] == 'SELL':
-                    position -= trade['amount']
-                    
         return {
             'symbol': symbol,
-            'position': position,
+            'position': float(self._positions.get(symbol, 0)),
             'timestamp': time.time()
         }
         
+    def get_all_positions(self) -> Dict[str, float]:
+        """
+        Get the current position for every symbol in the trade history.
+        
+        Returns:
+            Dictionary mapping symbol to net position
+        """
+        return {symbol: float(position) for symbol, position in self._positions.items()}
+        
     def reset_history(self):
         """Reset the trade history."""
-        self.trade_history = []
+        self.trade_history.clear()
+        self._positions.clear()
         self.logger.info("Trade history reset") 
\ No newline at end of file
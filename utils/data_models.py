@@ -1,6 +1,28 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, Dict, Any
 
+def slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields (dataclass(slots=True) needs Python 3.10).
+    
+    Args:
+        cls: Class already processed by @dataclass
+        
+    Returns:
+        Equivalent class whose instances have no __dict__
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = field_names
+    # Field defaults live on the class and would clash with the slot descriptors;
+    # the generated __init__ already carries them
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+@slotted
 @dataclass
 class PriceUpdate:
     symbol: str
@@ -10,6 +32,7 @@ class PriceUpdate:
     volume: Optional[float] = None
     indicators: Optional[Dict[str, Any]] = None
 
+@slotted
 @dataclass
 class AIResult:
     analysis: str
@@ -17,6 +40,7 @@ class AIResult:
     confidence: float
     metadata: Optional[Dict[str, Any]] = None
 
+@slotted
 @dataclass
 class OrderReceipt:
     order_id: str
@@ -25,5 +49,16 @@ class OrderReceipt:
     quantity: float
     price: Optional[float]
     status: str
-    exchange: str
-    metadata: Optional[Dict[str, Any]] = None 
\ No newline at end of file
+    exchange: Optional[str]
+    metadata: Optional[Dict[str, Any]] = None
+
+@slotted
+@dataclass
+class TradeRecord:
+    timestamp: int  # nanoseconds since the epoch
+    action: str
+    symbol: str
+    amount: float
+    price: Optional[float]
+    slippage: float
+    status: str 
\ No newline at end of file
@@ -1,6 +1,10 @@
+import atexit
 import logging
+import os
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 # Configure logging
 logger = logging.getLogger('nos_trade')
@@ -10,15 +14,39 @@ logger.setLevel(logging.INFO)
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.INFO)
 
-# Create file handler
-file_handler = logging.FileHandler(f'logs/nos_trade_{datetime.now().strftime("%Y%m%d")}.log')
-file_handler.setLevel(logging.INFO)
-
 # Create formatter
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(formatter)
-file_handler.setFormatter(formatter)
+handlers = [console_handler]
+
+# Create file handler; delay=True defers opening the file until the first record.
+# If logs/ cannot be created (e.g. a read-only working directory), log to the console only.
+try:
+    os.makedirs('logs', exist_ok=True)
+except OSError as e:
+    file_handler = None
+    print(f"File logging disabled: {e}", file=sys.stderr)
+else:
+    file_handler = logging.FileHandler(f'logs/nos_trade_{datetime.now():%Y%m%d}.log', delay=True)
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+
+# Callers only enqueue records; a background listener thread does the console and file I/O
+log_queue = SimpleQueue()
+queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+queue_listener.start()
+atexit.register(queue_listener.stop)
 
 # Add handlers to logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler) 
\ No newline at end of file
+logger.addHandler(QueueHandler(log_queue))
+
+def disable_record_metadata():
+    """
+    Stop LogRecords from collecting thread and process info, which none of the
+    nos_trade formats print. This changes logging globally, so only call it from
+    an entry point that owns the process's logging configuration.
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False